@@ -0,0 +1,88 @@
+"""Throughput of models versus number of threads.
+
+Run with free-threaded Python (3.13+, e.g. `python3.13t`) to see how creating
+and casting models scales without GIL::
+
+    PYTHONPATH=. python benchmarks/threads.py --threads 1 2 4 8
+
+"""
+import argparse
+import sys
+import threading
+import time
+
+from jsonmodels import models, fields
+
+
+class Address(models.Base):
+
+    street = fields.StringField(required=True)
+    city = fields.StringField()
+
+
+class Person(models.Base):
+
+    name = fields.StringField(required=True)
+    age = fields.IntField()
+    address = fields.EmbeddedField(Address)
+    tags = fields.ListField(str)
+
+
+STRUCT = {
+    'name': 'Chuck',
+    'age': 42,
+    'address': {'street': 'Main', 'city': 'Springfield'},
+    'tags': ['a', 'b', 'c'],
+}
+
+
+def create(count):
+    for _ in range(count):
+        Person(**STRUCT)
+
+
+def cast(count):
+    person = Person(**STRUCT)
+    for _ in range(count):
+        person.to_struct()
+
+
+def measure(operation, threads, operations):
+    per_thread = operations // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def run():
+        barrier.wait()
+        operation(per_thread)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operations', type=int, default=100000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {} (GIL {})'.format(
+        sys.version.split()[0], 'enabled' if gil else 'disabled'))
+    print('{:>8} {:>16} {:>16}'.format(
+        'threads', 'Model(**d) op/s', 'to_struct() op/s'))
+    for threads in args.threads:
+        print('{:>8} {:>16.0f} {:>16.0f}'.format(
+            threads,
+            measure(create, threads, args.operations),
+            measure(cast, threads, args.operations),
+        ))
+
+
+if __name__ == '__main__':
+    main()
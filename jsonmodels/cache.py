@@ -0,0 +1,172 @@
+"""Optional on-disk cache of generated JSON schemas.
+
+Generating schemas of many models at each start of program takes time. When
+cache directory is set (with `enable` or `JSONMODELS_CACHE_DIR` environment
+variable), generated schemas are stored there with `marshal` and loaded on
+the next run.
+
+Schema is stored under key made of sources of modules of the model and all
+models it refers to, and of sources of the library itself, so any change of
+them makes new schema be generated. Models which can't be imported by their
+name (e.g. defined in functions or generated) are never cached.
+
+Schemas once loaded or generated are also kept in memory (marshalled, so
+each call gets its own copy), until fields of any model are changed.
+
+"""
+
+import hashlib
+import importlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from weakref import WeakKeyDictionary
+
+from . import fields
+
+_directory = os.environ.get('JSONMODELS_CACHE_DIR') or None
+_source_hashes = {}
+_schemas = WeakKeyDictionary()
+_lock = threading.Lock()
+
+_LIBRARY_MODULES = (
+    'builders', 'cache', 'collections', 'errors', 'fields', 'instrumentation',
+    'memory', 'models', 'parsers', 'utilities', 'validators')
+
+
+def enable(directory):
+    """Store generated schemas in given directory."""
+    global _directory
+    os.makedirs(directory, exist_ok=True)
+    _directory = directory
+    forget_schemas()
+
+
+def disable():
+    global _directory
+    _directory = None
+    forget_schemas()
+
+
+def forget_schemas():
+    """Drop schemas kept in memory (e.g. when fields of model changed)."""
+    with _lock:
+        _schemas.clear()
+
+
+def get_schema(cls, build):
+    """Get schema of model from cache, building and storing it if missing.
+
+    :param cls: Model class.
+    :param build: Function generating schema of model.
+
+    """
+    directory = _directory
+    if directory is None:
+        return build(cls)
+    data = _schemas.get(cls)
+    if data is not None:
+        return marshal.loads(data)
+
+    key = model_key(cls)
+    if key is None:
+        return build(cls)
+
+    path = os.path.join(directory, key + '.marshal')
+    try:
+        with open(path, 'rb') as source:
+            data = source.read()
+        schema = marshal.loads(data)
+    except (OSError, EOFError, ValueError, TypeError):
+        schema = build(cls)
+        try:
+            data = marshal.dumps(schema)
+        except ValueError:
+            # Schema contains values, which can't be stored.
+            return schema
+        _write(path, data)
+
+    with _lock:
+        _schemas[cls] = data
+    return schema
+
+
+def model_key(cls):
+    """Get cache key of model, or `None` if it can't be cached."""
+    digest = hashlib.sha256()
+    for name in _LIBRARY_MODULES:
+        digest.update(_source_hash('jsonmodels.' + name))
+
+    for model in sorted(_referenced_models(cls), key=_qualified_name):
+        if not _is_importable(model):
+            return None
+        digest.update(_qualified_name(model).encode('utf-8'))
+        digest.update(_source_hash(model.__module__))
+    return digest.hexdigest()
+
+
+def _write(path, data):
+    try:
+        descriptor, temporary = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(descriptor, 'wb') as target:
+            target.write(data)
+        os.replace(temporary, path)
+    except OSError:
+        # Cache is only an optimization, schema was generated anyway.
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+
+
+def _referenced_models(cls):
+    found = set()
+    pending = [cls]
+    while pending:
+        model = pending.pop()
+        if model in found:
+            continue
+        found.add(model)
+        for _, field in model.iterate_over_fields():
+            field._finish_initialization(model)
+            pending.extend(_field_models(field))
+    return found
+
+
+def _field_models(field):
+    types = (getattr(field, 'items_types', None) or ()) + (field.types or ())
+    if isinstance(field, fields.MapField):
+        return (_field_models(field._key_field) +
+                _field_models(field._value_field))
+    if isinstance(field, fields.SetField):
+        return _field_models(field.item_field)
+    return [type_ for type_ in types if hasattr(type_, 'iterate_over_fields')]
+
+
+def _qualified_name(cls):
+    return '{}.{}'.format(cls.__module__, cls.__qualname__)
+
+
+def _is_importable(cls):
+    module = sys.modules.get(cls.__module__)
+    value = module
+    for name in cls.__qualname__.split('.'):
+        value = getattr(value, name, None)
+    return value is cls and getattr(module, '__file__', None) is not None
+
+
+def _source_hash(module_name):
+    with _lock:
+        result = _source_hashes.get(module_name)
+        if result is None:
+            module = importlib.import_module(module_name)
+            with open(module.__file__, 'rb') as source:
+                result = hashlib.sha256(source.read()).digest()
+            _source_hashes[module_name] = result
+    return result
@@ -1,22 +1,164 @@
-
-
 class ModelCollection(list):
 
     """`ModelCollection` is list which validates stored values.
 
     Validation is made with use of field passed to `__init__` at each point,
-    when new value is assigned.
+    when new value is assigned (by appending, inserting, extending or setting
+    items and slices). New values are validated all before collection is
+    changed, so it is left untouched when any of them is invalid. Values
+    passed to `__init__` must be already valid.
 
     """
 
-    def __init__(self, field):
-        super(ModelCollection, self).__init__()
+    def __init__(self, field, values=()):
+        super(ModelCollection, self).__init__(values)
         self.field = field
 
     def append(self, value):
         self.field.validate_single_value(value)
         super(ModelCollection, self).append(value)
 
-    def __setitem__(self, key, value):
+    def insert(self, index, value):
         self.field.validate_single_value(value)
+        super(ModelCollection, self).insert(index, value)
+
+    def extend(self, values):
+        super(ModelCollection, self).extend(self._validate_many(values))
+
+    def __iadd__(self, values):
+        return super(ModelCollection, self).__iadd__(
+            self._validate_many(values))
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = self._validate_many(value)
+        else:
+            self.field.validate_single_value(value)
         super(ModelCollection, self).__setitem__(key, value)
+
+    def _validate_many(self, values):
+        values = list(values)
+        validate = self.field.validate_single_value
+        for value in values:
+            validate(value)
+        return values
+
+
+class IndexedCollection(ModelCollection):
+
+    """`ModelCollection` keeping index of its values.
+
+    Values are indexed by key given by `index_key` method of field, so they
+    can be found by it without going through the whole list. Index is kept
+    up to date when values are added, replaced or removed, but not when keys
+    of values already in the collection change - `reindex` must be called
+    then.
+
+    """
+
+    def __init__(self, field, values=()):
+        super(IndexedCollection, self).__init__(field, values)
+        self.reindex()
+
+    def find(self, *key):
+        """Get first value with given key, or `None`."""
+        values = self._index.get(self._lookup_key(key))
+        return values[0] if values else None
+
+    def find_all(self, *key):
+        """Get all values with given key."""
+        return list(self._index.get(self._lookup_key(key), ()))
+
+    def reindex(self):
+        """Build index from scratch."""
+        self._index = {}
+        for value in self:
+            self._add(value)
+
+    def append(self, value):
+        super(IndexedCollection, self).append(value)
+        self._add(value)
+
+    def insert(self, index, value):
+        super(IndexedCollection, self).insert(index, value)
+        self._add(value)
+
+    def extend(self, values):
+        start = len(self)
+        super(IndexedCollection, self).extend(values)
+        for value in self[start:]:
+            self._add(value)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __imul__(self, times):
+        super(IndexedCollection, self).__imul__(times)
+        self.reindex()
+        return self
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            super(IndexedCollection, self).__setitem__(key, value)
+            self.reindex()
+            return
+
+        old = self[key]
+        super(IndexedCollection, self).__setitem__(key, value)
+        self._remove(old)
+        self._add(value)
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            super(IndexedCollection, self).__delitem__(key)
+            self.reindex()
+            return
+
+        old = self[key]
+        super(IndexedCollection, self).__delitem__(key)
+        self._remove(old)
+
+    def pop(self, index=-1):
+        value = super(IndexedCollection, self).pop(index)
+        self._remove(value)
+        return value
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def clear(self):
+        super(IndexedCollection, self).clear()
+        self._index = {}
+
+    def _lookup_key(self, key):
+        return key[0] if len(key) == 1 else key
+
+    def _add(self, value):
+        self._index.setdefault(self.field.index_key(value), []).append(value)
+
+    def _remove(self, value):
+        key = self.field.index_key(value)
+        values = self._index.get(key, ())
+        for position, indexed in enumerate(values):
+            if indexed is value:
+                del values[position]
+                if not values:
+                    del self._index[key]
+                return
+        # Key of value was changed since it was added.
+        self.reindex()
+
+
+class FrozenDict(dict):
+
+    """`dict` which can't be changed, used for values of frozen models."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("'FrozenDict' object does not support changes.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
@@ -6,6 +6,19 @@ class ValidationError(RuntimeError):
     The base validation error
     """
 
+    def __reduce__(self):
+        # Subclasses take different arguments than they keep in `args`, so
+        # they are restored without calling `__init__`.
+        return _restore_error, (type(self), self.args, self.__dict__)
+
+
+def _restore_error(error_type: Type, args: Tuple, attributes: dict):
+    """ Recreates pickled validation error """
+    error = error_type.__new__(error_type)
+    error.args = args
+    error.__dict__.update(attributes)
+    return error
+
 
 class FieldNotFound(RuntimeError):
     """ Error raised when a field is not found """
@@ -17,6 +30,19 @@ class FieldNotFound(RuntimeError):
         self.field_name = field_name
 
 
+class FrozenModelError(AttributeError):
+    """ Error raised when changing value of a field of a frozen model """
+    def __init__(self, model_name: str, field_name: str):
+        """
+        :param model_name: The name of the model.
+        :param field_name: The name of the field.
+        """
+        super(FrozenModelError, self).__init__(
+            'Model is frozen', model_name, field_name)
+        self.model_name = model_name
+        self.field_name = field_name
+
+
 class FieldNotSupported(ValueError):
     def __init__(self, field_type: Type):
         super(FieldNotSupported, self).__init__(
@@ -195,3 +221,19 @@ class EnumError(ValidatorError):
         super(EnumError, self).__init__(tpl.format(val=value))
         self.value = value
         self.choices = choices
+
+
+class IndexKeyError(ValidatorError):
+    """ Error raised when item of indexed list has no usable index key """
+
+    def __init__(self, value: any, index_by: Tuple):
+        """
+        :param value: The given item.
+        :param index_by: The names of indexed fields.
+        """
+        tpl = "Item '{value}' has no hashable values of '{names}'."
+        super(IndexKeyError, self).__init__(tpl.format(
+            value=value, names=', '.join(index_by)
+        ))
+        self.value = value
+        self.index_by = index_by
@@ -1,4 +1,11 @@
+import asyncio
+import inspect
+import os
+import sys
+import threading
 import warnings
+from collections import OrderedDict
+from collections.abc import Hashable
 from weakref import WeakKeyDictionary
 
 import datetime
@@ -7,12 +14,25 @@ import six
 from dateutil.parser import parse
 from typing import List, Optional, Dict, Set, Union, Pattern
 
-from .collections import ModelCollection
-from .errors import RequiredFieldError, BadTypeError, AmbiguousTypeError
+from .collections import ModelCollection, IndexedCollection, FrozenDict
+from .utilities import merge_patch
+from .errors import RequiredFieldError, BadTypeError, AmbiguousTypeError, \
+    IndexKeyError
+
+
+class _NotSetType(object):
+
+    def __repr__(self):
+        return 'NotSet'
+
+    def __reduce__(self):
+        # Keeps marker unique when pickled.
+        return 'NotSet'
+
 
 # unique marker for "no default value specified". None is not good enough since
 # it is a completely valid default value.
-NotSet = object()
+NotSet = _NotSetType()
 
 # BSON compatible types, which can be returned by toBsonEncodable.
 BsonEncodable = Union[
@@ -27,6 +47,12 @@ class BaseField(object):
 
     types = None
 
+    # Attributes the compiled validation function depends on. Assigning any
+    # of them discards the compiled function, so it is rebuilt on next use.
+    _validation_settings = frozenset(
+        ['types', 'required', 'nullable', '_validator_calls'])
+    _compiled_validate = None
+
     def __init__(
             self,
             required=False,
@@ -34,8 +60,14 @@ class BaseField(object):
             help_text=None,
             validators=None,
             default=NotSet,
-            name=None):
-        self.memory = WeakKeyDictionary()
+            name=None,
+            default_factory=None,
+            parse_cache_size=0):
+        if default is not NotSet and default_factory is not None:
+            raise ValueError(
+                "Only one of 'default' and 'default_factory' can be given.")
+        self.memory = _new_memory()
+        self._initialization_lock = threading.RLock()
         self.required = required
         self.help_text = help_text
         self.nullable = nullable
@@ -44,16 +76,37 @@ class BaseField(object):
         self._validate_name()
         if default is not NotSet:
             self.validate(default)
+        elif default_factory is not None:
+            self.validate(default_factory())
         self._default = default
+        self._default_factory = default_factory
+        self.parse_cache = None
+        if parse_cache_size:
+            self.parse_cache = ParseCache(parse_cache_size)
+            self.parse_value = self._parse_value_cached
 
     @property
     def has_default(self):
-        return self._default is not NotSet
+        return self._default is not NotSet or self._default_factory is not None
 
     def _assign_validators(self, validators):
-        if validators and not isinstance(validators, list):
-            validators = [validators]
-        self.validators = validators or []
+        self.validators = validators
+
+    def __setattr__(self, name, value):
+        if name in ('validators', 'item_validators'):
+            # Tuple, so changing validators in place fails instead of being
+            # silently ignored by compiled calls.
+            value = _validators_tuple(value)
+        super(BaseField, self).__setattr__(name, value)
+        if name == 'validators':
+            self._validator_calls = _compile_validators(value)
+            self._async_validator_calls = _compile_async_validators(value)
+        elif name == 'item_validators':
+            self._item_validator_calls = _compile_validators(value)
+            self._async_item_validator_calls = _compile_async_validators(
+                value)
+        elif name in self._validation_settings:
+            self._compiled_validate = None
 
     def __set__(self, instance, value):
         self._finish_initialization(type(instance))
@@ -74,15 +127,71 @@ class BaseField(object):
     def _finish_initialization(self, owner):
         pass
 
+    def _store(self, instance, value):
+        """Store value without parsing nor validating it."""
+        self._finish_initialization(type(instance))
+        self.memory[instance._cache_key] = value
+
+    def _to_state(self, value):
+        """Convert stored value to form that can be pickled."""
+        return value
+
+    def _from_state(self, value):
+        """Convert unpickled value back to stored form."""
+        return value
+
+    def _peek(self, instance):
+        """Get value of instance without installing default."""
+        try:
+            return self.memory[instance._cache_key]
+        except KeyError:
+            pass
+        if self._default is not NotSet:
+            return self._default
+        return self.get_default_value()
+
     def _check_value(self, obj):
         if obj._cache_key not in self.memory:
-            self.__set__(obj, self.get_default_value())
+            self._install_default(obj)
+
+    def _install_default(self, obj):
+        value = self.get_default_value()
+        if self._default is NotSet:
+            # Results of factory may differ each time, so they are checked
+            # as any assigned value.
+            value = self.parse_value(value)
+            self.validate(value)
+        # Default was already validated when field was defined. When other
+        # thread installs value first, it wins and is kept.
+        self.memory.setdefault(obj._cache_key, value)
 
     def validate_for_object(self, obj):
         value = self.__get__(obj)
         self.validate(value)
 
     def validate(self, value):
+        validate = self._compiled_validate
+        if validate is None:
+            validate = self._compiled_validate = self._compile_validate()
+        validate(value)
+
+    def _compile_validate(self):
+        """Build validation function specialized for field configuration.
+
+        Steps of validation are merged into single closure, so validating
+        value doesn't need to look up field attributes again. Fields that
+        override any of the steps get them called one by one.
+
+        """
+        if self.types is None or _overrides_validation_steps(type(self)):
+            return self._validate_steps
+
+        if not self._validator_calls:
+            return _compile_type_check(self.types, self.required)
+        return _compile_full_check(
+            self.types, self.required, self.nullable, self._validator_calls)
+
+    def _validate_steps(self, value):
         self._check_types()
         self._validate_against_types(value)
         self._check_against_required(value)
@@ -162,28 +271,91 @@ class BaseField(object):
         """
         return value
 
+    async def _parse_value_async(self, value, chunk_size):
+        """Parse value, yielding to event loop every `chunk_size` items."""
+        return self.parse_value(value)
+
+    async def _validate_async(self, value, chunk_size):
+        """Validate value, yielding to event loop every `chunk_size` items."""
+        self.validate(value)
+
+    async def _to_struct_async(self, value, chunk_size):
+        """Cast value, yielding to event loop every `chunk_size` items."""
+        return self.to_struct(value)
+
+    def _merge_patch(self, value, patch):
+        """Apply JSON merge patch to value, returning patched value.
+
+        Patched value is parsed and validated. Values are replaced by
+        default, fields holding objects merge them.
+
+        """
+        patched = self.parse_value(patch)
+        self.validate(patched)
+        return patched
+
+    def _parse_value_cached(self, value):
+        """Parse value, reusing results for inputs seen recently.
+
+        Results are shared only if they are immutable, mutable results are
+        copied each time.
+
+        """
+        try:
+            key = structure_key(value)
+            result = self.parse_cache.get(key)
+        except TypeError:
+            return type(self).parse_value(self, value)
+
+        if result is NotSet:
+            result = type(self).parse_value(self, value)
+            self.parse_cache.set(key, result)
+        return self._copy_value(result)
+
+    def _async_checks(self, value):
+        """Get asynchronous validations of value.
+
+        Yields `(validator, value)` pairs to be awaited, and models which
+        need to be checked as well.
+
+        """
+        if value is None and self.nullable:
+            return
+        for validator in self._async_validator_calls:
+            yield validator, value
+
     def _validate_with_custom_validators(self, value):
         if value is None and self.nullable:
             return
 
-        for validator in self.validators:
-            try:
-                validator.validate(value)
-            except AttributeError:
-                validator(value)
+        for validator in self._validator_calls:
+            validator(value)
 
     def get_default_value(self):
         """Get default value for field.
 
-        Each field can specify its default.
+        Each field can specify its default. Mutable defaults are copied, so
+        every model instance gets its own value, created on first access.
 
         """
-        return self._default if self.has_default else None
+        if self._default_factory is not None:
+            return self._copy_value(self._default_factory())
+        if self._default is NotSet:
+            return None
+        return self._copy_value(self._default)
+
+    def _copy_value(self, value):
+        """Copy value, so it can be changed independently of the original.
+
+        Immutable values are shared instead of copied.
+
+        """
+        return value
 
     def _validate_name(self):
         if self.name is None:
             return
-        if not re.match(r'^[A-Za-z_](([\w\-]*)?\w+)?$', self.name):
+        if not is_valid_name(self.name):
             raise ValueError('Wrong name', self.name)
 
     def structure_name(self, default):
@@ -243,6 +415,7 @@ class ListField(BaseField):
     """List field."""
 
     types = (list, tuple)
+    _collection_type = ModelCollection
 
     def __init__(self, items_types=None, item_validators=(), omit_empty=False,
                  *args, **kwargs):
@@ -255,9 +428,7 @@ class ListField(BaseField):
 
         """
         self._assign_types(items_types)
-        self.item_validators = [item_validators] \
-            if item_validators and not isinstance(item_validators, list) \
-            else item_validators or []
+        self.item_validators = item_validators
         super(ListField, self).__init__(*args, **kwargs)
         self.required = False
         self._omit_empty = omit_empty
@@ -265,9 +436,31 @@ class ListField(BaseField):
     def get_default_value(self):
         default = super(ListField, self).get_default_value()
         if default is None:
-            return ModelCollection(self)
+            return self._collection_type(self)
         return default
 
+    def _copy_value(self, values):
+        if values is None:
+            return values
+        items = [self._copy_item(value) for value in values]
+        if isinstance(values, tuple):
+            return tuple(items)
+        return self._collection_type(self, items)
+
+    def _copy_item(self, value):
+        return _copy_any(value)
+
+    def _to_state(self, values):
+        # Collection keeps reference to field, which can't be pickled.
+        if isinstance(values, ModelCollection):
+            return list(values)
+        return values
+
+    def _from_state(self, values):
+        if isinstance(values, list):
+            return self._collection_type(self, values)
+        return values
+
     def _assign_types(self, items_types):
         if items_types:
             try:
@@ -287,16 +480,16 @@ class ListField(BaseField):
 
     def validate(self, value):
         super(ListField, self).validate(value)
+        if isinstance(value, ModelCollection) and value.field is self:
+            # Collection validates all its values, when they are added.
+            return
 
         for item in value:
             self.validate_single_value(item)
 
     def validate_single_value(self, value):
-        for validator in self.item_validators:
-            try:
-                validator.validate(value)
-            except AttributeError:
-                validator(value)
+        for validator in self._item_validator_calls:
+            validator(value)
 
         if len(self.items_types) == 0:
             return
@@ -304,37 +497,57 @@ class ListField(BaseField):
         if not isinstance(value, self.items_types):
             raise BadTypeError(value, self.items_types, is_list=True)
 
+    def _async_checks(self, values):
+        for check in super(ListField, self)._async_checks(values):
+            yield check
+        if values and (self._async_item_validator_calls or
+                       _has_model_types(self.items_types)):
+            for value in values:
+                for check in self._async_item_checks(value):
+                    yield check
+
+    def _async_item_checks(self, value):
+        for validator in self._async_item_validator_calls:
+            yield validator, value
+        if _is_model(value):
+            yield value
+
     def parse_value(self, values):
         """Cast value to proper collection."""
-        result = self.get_default_value()
-
         if not values:
-            return result
+            return self.get_default_value()
 
         if not isinstance(values, list):
             return values
 
+        return self._to_collection(self._parse_items(values))
+
+    def _parse_items(self, values):
         return [self._cast_value(value) for value in values]
 
+    def _to_collection(self, values):
+        """Make collection of parsed values, validating them."""
+        collection = self._collection_type(self)
+        collection.extend(values)
+        return collection
+
     def _cast_value(self, value):
         if isinstance(value, self.items_types):
             return value
         elif isinstance(value, dict):
             model_type = self._get_embed_type(value, self.items_types)
-            return model_type(**value)
+            return model_type.from_struct(value)
         else:
             raise BadTypeError(value, self.items_types, is_list=True)
 
     def _finish_initialization(self, owner):
         super(ListField, self)._finish_initialization(owner)
+        if not _has_lazy_types(self.items_types):
+            return
 
-        types = []
-        for item_type in self.items_types:
-            if isinstance(item_type, _LazyType):
-                types.append(item_type.evaluate(owner))
-            else:
-                types.append(item_type)
-        self.items_types = tuple(types)
+        with self._initialization_lock:
+            if _has_lazy_types(self.items_types):
+                self.items_types = _evaluate_types(self.items_types, owner)
 
     def _elem_to_struct(self, value):
         try:
@@ -346,6 +559,72 @@ class ListField(BaseField):
         return [self._elem_to_struct(v) for v in values] \
             if values or not self._omit_empty else None
 
+    async def _parse_value_async(self, values, chunk_size):
+        if not isinstance(values, list) or len(values) <= chunk_size:
+            return self.parse_value(values)
+        result = self._collection_type(self)
+        for chunk in _slices(values, chunk_size):
+            result.extend(self._parse_items(chunk))
+            await asyncio.sleep(0)
+        return result
+
+    async def _validate_async(self, values, chunk_size):
+        BaseField.validate(self, values)
+        if isinstance(values, ModelCollection) and values.field is self:
+            return
+        for chunk in _slices(values, chunk_size):
+            for value in chunk:
+                self.validate_single_value(value)
+            await asyncio.sleep(0)
+
+    async def _to_struct_async(self, values, chunk_size):
+        if not values:
+            return self.to_struct(values)
+        result = []
+        for chunk in _slices(values, chunk_size):
+            result.extend(self.to_struct(chunk))
+            await asyncio.sleep(0)
+        return result
+
+
+class IndexedListField(ListField):
+
+    """List field, which keeps index of its items by values of their fields.
+
+    Items can be then found by `find` and `find_all` methods of the list,
+    without going through all of them. Values of indexed fields must be
+    hashable and must not be changed while item is in the list (or `reindex`
+    must be called afterwards). In structures and schema it is normal list.
+
+    """
+
+    _collection_type = IndexedCollection
+
+    def __init__(self, items_types=None, index_by=None, *args, **kwargs):
+        """Init.
+
+        :param index_by: Name of field (or tuple of names) of items, by
+            which they are indexed.
+
+        """
+        if not index_by:
+            raise ValueError('Names of indexed fields must be given.')
+        self.index_by = (index_by,) \
+            if isinstance(index_by, six.string_types) else tuple(index_by)
+        super(IndexedListField, self).__init__(items_types, *args, **kwargs)
+
+    def index_key(self, value):
+        """Get key of item in index."""
+        key = tuple(getattr(value, name) for name in self.index_by)
+        return key[0] if len(key) == 1 else key
+
+    def validate_single_value(self, value):
+        super(IndexedListField, self).validate_single_value(value)
+        try:
+            hash(self.index_key(value))
+        except (AttributeError, TypeError):
+            raise IndexKeyError(value, self.index_by)
+
 
 class DerivedListField(ListField):
     """
@@ -380,11 +659,24 @@ class DerivedListField(ListField):
         :param values: The values in the list.
         :return: The converted values.
         """
+        return self._to_collection(self._parse_items(values))
+
+    def _parse_items(self, values):
         try:
             return [self._field.parse_value(value) for value in values]
         except TypeError:
             raise BadTypeError(values, self._field.types, is_list=True)
 
+    def _copy_item(self, value):
+        return self._field._copy_value(value)
+
+    def _async_checks(self, values: List[any]):
+        for check in BaseField._async_checks(self, values):
+            yield check
+        for value in values or ():
+            for check in self._field._async_checks(value):
+                yield check
+
     def validate_single_value(self, value: any) -> None:
         """
         Validates a single value in the list.
@@ -415,14 +707,12 @@ class EmbeddedField(BaseField):
 
     def _finish_initialization(self, owner):
         super(EmbeddedField, self)._finish_initialization(owner)
-        types = []
-        for model_type in self.types:
-            if isinstance(model_type, _LazyType):
-                types.append(model_type.evaluate(owner))
-            else:
-                types.append(model_type)
+        if not _has_lazy_types(self.types):
+            return
 
-        self.types = tuple(types)
+        with self._initialization_lock:
+            if _has_lazy_types(self.types):
+                self.types = _evaluate_types(self.types, owner)
 
     def validate(self, value):
         super(EmbeddedField, self).validate(value)
@@ -431,17 +721,54 @@ class EmbeddedField(BaseField):
         except AttributeError:
             pass
 
+    def _async_checks(self, value):
+        for check in super(EmbeddedField, self)._async_checks(value):
+            yield check
+        if _is_model(value):
+            yield value
+
     def parse_value(self, value):
         """Parse value to proper model type."""
         if not isinstance(value, dict):
             return value
 
         embed_type = self._get_embed_type(value, self.types)
-        return embed_type(**value)
+        return embed_type.from_struct(value)
 
     def to_struct(self, value):
         return value.to_struct()
 
+    async def _parse_value_async(self, value, chunk_size):
+        if not isinstance(value, dict):
+            return value
+        embed_type = self._get_embed_type(value, self.types)
+        return await embed_type.from_struct_async(value, chunk_size)
+
+    async def _validate_async(self, value, chunk_size):
+        BaseField.validate(self, value)
+        if _is_model(value):
+            await value._validate_chunked(chunk_size)
+
+    async def _to_struct_async(self, value, chunk_size):
+        return await value.to_struct_async(chunk_size)
+
+    def _merge_patch(self, value, patch):
+        from .models import Base, FrozenBase
+        if not isinstance(patch, dict):
+            return super(EmbeddedField, self)._merge_patch(value, patch)
+        if isinstance(value, Base) and not isinstance(value, FrozenBase):
+            # Patch copy, so value is left untouched when patch is invalid.
+            patched = value.clone()
+            patched.apply_patch(patch)
+            return patched
+        if isinstance(value, Base):
+            value = value.to_struct()
+        return super(EmbeddedField, self)._merge_patch(
+            value, merge_patch(value, patch))
+
+    def _copy_value(self, value):
+        return value.clone() if value is not None else None
+
 
 class MapField(BaseField):
     """
@@ -464,9 +791,9 @@ class MapField(BaseField):
             validating the values in this mapping.
         :param kwargs: Other keyword arguments to the base class.
         """
-        super(MapField, self).__init__(**kwargs)
         self._key_field = key_field
         self._value_field = value_field
+        super(MapField, self).__init__(**kwargs)
 
     def _finish_initialization(self, owner):
         """
@@ -493,7 +820,45 @@ class MapField(BaseField):
              self._value_field.parse_value(value))
             for key, value in values.items()
         ]
-        return type(values)(items)  # Preserves OrderedDict
+        return _dict_type(values)(items)  # Preserves OrderedDict
+
+    def _merge_patch(self, values: Optional[dict], patch: any) -> any:
+        """
+        Merges the patch into the mapping, parsing and validating only the
+        patched keys and values.
+        """
+        if not isinstance(patch, dict):
+            return super(MapField, self)._merge_patch(values, patch)
+        # Patch copy, so values are left untouched when patch is invalid.
+        values = _dict_type(values)(values) if values is not None else {}
+
+        removed = []
+        changed = []
+        for key, value in patch.items():
+            key = self._key_field.parse_value(key)
+            self._key_field.validate(key)
+            if value is None:
+                removed.append(key)
+            else:
+                changed.append((key, self._value_field._merge_patch(
+                    values.get(key), value)))
+
+        for key in removed:
+            values.pop(key, None)
+        values.update(changed)
+        BaseField.validate(self, values)
+        return values
+
+    def _copy_value(self, values: Optional[dict]) -> Optional[dict]:
+        """ Copies keys and values into a new dict. """
+        if values is None:
+            return values
+        items = [
+            (self._key_field._copy_value(key),
+             self._value_field._copy_value(value))
+            for key, value in values.items()
+        ]
+        return _dict_type(values)(items)  # Preserves OrderedDict
 
     def to_struct(self, values: Optional[dict]) -> Optional[dict]:
         """ Casts the field values into a dict. """
@@ -502,7 +867,7 @@ class MapField(BaseField):
              self._value_field.to_struct(value))
             for key, value in values.items()
         ]
-        return type(values)(items)  # Preserves OrderedDict
+        return _dict_type(values)(items)  # Preserves OrderedDict
 
     def validate(self, values: Optional[dict]) -> Optional[dict]:
         """
@@ -516,6 +881,391 @@ class MapField(BaseField):
             self._key_field.validate(key)
             self._value_field.validate(value)
 
+    async def _parse_value_async(self, values: Optional[dict],
+                                 chunk_size: int) -> Optional[dict]:
+        if not isinstance(values, dict) or len(values) <= chunk_size:
+            return self.parse_value(values)
+        result = _dict_type(values)()
+        for chunk in _slices(list(values.items()), chunk_size):
+            result.update(self.parse_value(_dict_type(values)(chunk)))
+            await asyncio.sleep(0)
+        return result
+
+    async def _validate_async(self, values: Optional[dict],
+                              chunk_size: int) -> None:
+        BaseField.validate(self, values)
+        for chunk in _slices(list((values or {}).items()), chunk_size):
+            for key, value in chunk:
+                self._key_field.validate(key)
+                self._value_field.validate(value)
+            await asyncio.sleep(0)
+
+    async def _to_struct_async(self, values: Optional[dict],
+                               chunk_size: int) -> Optional[dict]:
+        if len(values) <= chunk_size:
+            return self.to_struct(values)
+        result = _dict_type(values)()
+        for chunk in _slices(list(values.items()), chunk_size):
+            result.update(self.to_struct(_dict_type(values)(chunk)))
+            await asyncio.sleep(0)
+        return result
+
+    def _async_checks(self, values: Optional[dict]):
+        for check in super(MapField, self)._async_checks(values):
+            yield check
+        for key, value in (values or {}).items():
+            for check in self._key_field._async_checks(key):
+                yield check
+            for check in self._value_field._async_checks(value):
+                yield check
+
+
+class SetField(BaseField):
+    """
+    Model field that keeps a set of values of another field.
+    Values are kept in `set` (or `frozenset`), so they are unique and
+    checking membership is fast. Values must be hashable.
+
+    In structures values are sorted by their structure, so output is always
+    the same (it is array with unique items in schema).
+    """
+    types = (set, frozenset)
+
+    def __init__(self, item_field: BaseField, sort_key=None, **kwargs):
+        """
+        :param item_field: The field that is responsible for converting and
+            validating the values in this set.
+        :param sort_key: Function giving sorting key for structure of value,
+            by default structures are compared directly (or by their `repr`,
+            if they can't be).
+        :param kwargs: Other keyword arguments to the base class.
+        """
+        self._item_field = item_field
+        self.item_validators = item_field.validators
+        self._sort_key = sort_key
+        super(SetField, self).__init__(**kwargs)
+
+    @property
+    def item_field(self) -> BaseField:
+        return self._item_field
+
+    def _finish_initialization(self, owner):
+        super(SetField, self)._finish_initialization(owner)
+        self._item_field._finish_initialization(owner)
+
+    def get_default_value(self) -> any:
+        """ Gets the default value for this field """
+        default = super(SetField, self).get_default_value()
+        if default is None and self.required:
+            return set()
+        return default
+
+    def parse_value(self, values: any) -> Optional[Set]:
+        """ Parses the given values (any iterable) into a new set. """
+        values = super(SetField, self).parse_value(values)
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            return values
+        result = set()
+        for value in values:
+            value = self._item_field.parse_value(value)
+            try:
+                result.add(value)
+            except TypeError:
+                raise BadTypeError(value, (Hashable,), is_list=True)
+        return result
+
+    def _copy_value(self, values: Optional[Set]) -> Optional[Set]:
+        # Values are hashable, so they can be shared.
+        return set(values) if isinstance(values, set) else values
+
+    def validate(self, values: Optional[Set]) -> None:
+        """
+        Validates all values in the set.
+        :param values: The values in the set.
+        """
+        super(SetField, self).validate(values)
+        for value in values or ():
+            self._item_field.validate(value)
+
+    def to_struct(self, values: Optional[Set]) -> List[any]:
+        """ Casts the values into a sorted list. """
+        return [struct for struct, _ in self._ordered(values)]
+
+    def toBsonEncodable(self, values: Optional[Set]) -> List[any]:
+        return [self._item_field.toBsonEncodable(value)
+                for _, value in self._ordered(values)]
+
+    def _ordered(self, values: Optional[Set]) -> List[tuple]:
+        """ Gives `(structure, value)` pairs sorted by structures. """
+        pairs = [(self._item_field.to_struct(value), value)
+                 for value in values]
+        if self._sort_key is not None:
+            pairs.sort(key=lambda pair: self._sort_key(pair[0]))
+            return pairs
+        try:
+            pairs.sort(key=lambda pair: pair[0])
+        except TypeError:
+            pairs.sort(key=lambda pair: repr(pair[0]))
+        return pairs
+
+    def _async_checks(self, values: Optional[Set]):
+        for check in super(SetField, self)._async_checks(values):
+            yield check
+        for value in values or ():
+            for check in self._item_field._async_checks(value):
+                yield check
+
+
+def _validators_tuple(validators):
+    if not validators:
+        return ()
+    if isinstance(validators, (list, tuple)):
+        return tuple(validators)
+    return validators,
+
+
+def _compile_validators(validators):
+    """Resolve validators to plain callables.
+
+    Validators may be objects with `validate` method or simple functions, so
+    dispatch is resolved once here instead of on every validated value.
+
+    """
+    calls = (getattr(validator, 'validate', validator)
+             for validator in validators)
+    return tuple(call for call in calls if not _is_coroutine_function(call))
+
+
+def _compile_async_validators(validators):
+    """Resolve asynchronous validators to plain coroutine functions.
+
+    They are run only by asynchronous validation of models.
+
+    """
+    calls = (getattr(validator, 'validate', validator)
+             for validator in validators)
+    return tuple(call for call in calls if _is_coroutine_function(call))
+
+
+def _is_coroutine_function(call):
+    """Check if call gives coroutine, also for objects with `async __call__`.
+    """
+    return inspect.iscoroutinefunction(call) or \
+        inspect.iscoroutinefunction(getattr(call, '__call__', None))
+
+
+def _slices(values, size):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _is_model(value):
+    from .models import Base
+    return isinstance(value, Base)
+
+
+def _has_model_types(types):
+    from .models import Base
+    return any(
+        isinstance(type_, type) and issubclass(type_, Base) for type_ in types)
+
+
+def _new_memory():
+    """Create storage of values of field, keyed by model cache keys.
+
+    Without GIL single dictionary shared by all threads using given model
+    would be a point of contention, so storage is split into shards then.
+
+    """
+    if _GIL_ENABLED:
+        return WeakKeyDictionary()
+    return ShardedMemory()
+
+
+def is_valid_name(name):
+    """Check if name can be used as structure name of field."""
+    return re.match(r'^[A-Za-z_](([\w\-]*)?\w+)?$', name) is not None
+
+
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+class ShardedMemory(object):
+
+    """Weak key dictionary split into shards by hash of key.
+
+    Supports the part of mapping interface used for storing field values.
+
+    """
+
+    def __init__(self, shards=None):
+        shards = shards or (os.cpu_count() or 1) * 2
+        self._shards = tuple(WeakKeyDictionary() for _ in range(shards))
+
+    def _shard(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __getitem__(self, key):
+        return self._shard(key)[key]
+
+    def __setitem__(self, key, value):
+        self._shard(key)[key] = value
+
+    def __delitem__(self, key):
+        del self._shard(key)[key]
+
+    def __contains__(self, key):
+        return key in self._shard(key)
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self):
+        for shard in self._shards:
+            for key in list(shard.keys()):
+                yield key
+
+    def get(self, key, default=None):
+        return self._shard(key).get(key, default)
+
+    def setdefault(self, key, default=None):
+        return self._shard(key).setdefault(key, default)
+
+    def items(self):
+        for shard in self._shards:
+            for item in list(shard.items()):
+                yield item
+
+
+def _compile_type_check(types, required):
+    def validate(value):
+        if value is None:
+            if required:
+                raise RequiredFieldError()
+        elif not isinstance(value, types):
+            raise BadTypeError(value, types, is_list=False)
+    return validate
+
+
+def _compile_full_check(types, required, nullable, validator_calls):
+    def validate(value):
+        if value is None:
+            if required:
+                raise RequiredFieldError()
+            if nullable:
+                return
+        elif not isinstance(value, types):
+            raise BadTypeError(value, types, is_list=False)
+        for validator in validator_calls:
+            validator(value)
+    return validate
+
+
+def _overrides_validation_steps(field_type):
+    return any(
+        getattr(field_type, name) is not getattr(BaseField, name)
+        for name in (
+            '_check_types',
+            '_validate_against_types',
+            '_check_against_required',
+            '_validate_with_custom_validators',
+        )
+    )
+
+
+class ParseCache(object):
+
+    """Bounded cache of parsed values, least recently used are dropped.
+
+    Counts `hits` and `misses`, so its usefulness can be checked.
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key):
+        """Get value for key, or `NotSet` if it isn't cached."""
+        try:
+            value = self._values[key]
+            self._values.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return NotSet
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self._values[key] = value
+        while len(self._values) > self.size:
+            try:
+                self._values.popitem(last=False)
+            except KeyError:
+                break
+
+    def clear(self):
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def structure_key(value):
+    """Make hashable key representing Python structure.
+
+    Types (also of containers) and order of items are part of the key, so
+    e.g. `1` and `True` or list and tuple are not mixed up. Raises
+    `TypeError` when structure contains unhashable values.
+
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(structure_key(item) for item in value)
+    if isinstance(value, dict):
+        return type(value), tuple(
+            (structure_key(key), structure_key(item))
+            for key, item in value.items())
+    return type(value), value
+
+
+def _copy_any(value):
+    """Copy models, lists and dicts recursively, sharing other values."""
+    from .models import Base
+    if isinstance(value, Base):
+        return value.clone()
+    if isinstance(value, list):
+        return [_copy_any(item) for item in value]
+    if isinstance(value, dict):
+        items = [(key, _copy_any(item)) for key, item in value.items()]
+        return _dict_type(value)(items)  # preserves OrderedDict
+    return value
+
+
+def _dict_type(values):
+    """Get type of dict made from values (frozen dicts give plain ones)."""
+    return dict if isinstance(values, FrozenDict) else type(values)
+
+
+def _has_lazy_types(types):
+    return any(isinstance(type_, _LazyType) for type_ in types)
+
+
+def _evaluate_types(types, owner):
+    """Evaluate lazy types.
+
+    Result is assigned at once by caller, so fields are never seen half
+    evaluated - lock is only needed to evaluate types once.
+
+    """
+    return tuple(
+        type_.evaluate(owner) if isinstance(type_, _LazyType) else type_
+        for type_ in types
+    )
+
 
 class _LazyType(object):
 
@@ -676,6 +1426,13 @@ class GenericField(BaseField):
     def _validate_against_types(self, value) -> None:
         pass
 
+    def _copy_value(self, values: any) -> any:
+        return _copy_any(values)
+
+    def _merge_patch(self, values: any, patch: any) -> any:
+        return super(GenericField, self)._merge_patch(
+            values, merge_patch(values, patch))
+
     def to_struct(self, values: any) -> any:
         """ Casts value to Python structure. """
         from .models import Base
@@ -688,6 +1445,6 @@ class GenericField(BaseField):
         if isinstance(values, dict):
             items = [(self.to_struct(key), self.to_struct(value))
                      for key, value in values.items()]
-            return type(values)(items)  # preserves OrderedDict
+            return _dict_type(values)(items)  # preserves OrderedDict
 
         return values
@@ -0,0 +1,156 @@
+"""Opt-in instrumentation of parsing, validation and casting of fields.
+
+Listeners are called with `(event, model_name, field_name, duration)` each
+time field of model parses value (`'parse_value'`), validates it
+(`'validate'`), casts it to structure (`'to_struct'`), resolves type of
+embedded model (`'embed_type'`) or installs default value (`'default'`).
+Duration is in seconds and includes nested calls (e.g. validation of
+embedded models).
+
+Fields are instrumented only while at least one listener is registered, so
+when there are none, there is no overhead at all. Events are reported for
+model class which declares the field.
+
+"""
+
+import threading
+import time
+from collections import namedtuple
+from weakref import WeakKeyDictionary
+
+from .fields import BaseField, NotSet
+
+EVENTS = {
+    'parse_value': 'parse_value',
+    'validate': 'validate',
+    'to_struct': 'to_struct',
+    '_get_embed_type': 'embed_type',
+    '_install_default': 'default',
+}
+
+Entry = namedtuple('Entry', ['count', 'time'])
+
+_listeners = ()
+_lock = threading.RLock()
+_originals = WeakKeyDictionary()
+
+
+def add_listener(listener):
+    """Register listener, instrumenting all models with the first one."""
+    global _listeners
+    with _lock:
+        if not _listeners:
+            _instrument_all()
+        _listeners += (listener,)
+
+
+def remove_listener(listener):
+    """Unregister listener, removing instrumentation with the last one."""
+    global _listeners
+    with _lock:
+        listeners = list(_listeners)
+        listeners.remove(listener)
+        _listeners = tuple(listeners)
+        if not _listeners:
+            _restore_all()
+
+
+def is_enabled():
+    return bool(_listeners)
+
+
+class Stats(object):
+
+    """Listener keeping count and cumulative time of events.
+
+    Entries are kept per `(model_name, field_name, event)`.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries = {}
+
+    def __call__(self, event, model_name, field_name, duration):
+        key = model_name, field_name, event
+        with self._lock:
+            count, total = self.entries.get(key, (0, 0.0))
+            self.entries[key] = Entry(count + 1, total + duration)
+
+    def by_model(self):
+        """Sum entries of all fields, per `(model_name, event)`."""
+        result = {}
+        with self._lock:
+            entries = list(self.entries.items())
+        for (model_name, _, event), entry in entries:
+            count, total = result.get((model_name, event), (0, 0.0))
+            result[model_name, event] = Entry(
+                count + entry.count, total + entry.time)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+
+def instrument_model(cls):
+    """Instrument fields declared by model class, if instrumentation is on.
+
+    Called for each new model class and when field is assigned to model
+    class (as it is done for models generated from schema).
+
+    """
+    if not _listeners:
+        return
+    with _lock:
+        if _listeners:
+            _instrument_fields(cls)
+
+
+def _instrument_all():
+    from .models import Base
+
+    classes = [Base]
+    while classes:
+        cls = classes.pop()
+        _instrument_fields(cls)
+        classes.extend(cls.__subclasses__())
+
+
+def _instrument_fields(cls):
+    for name, field in list(vars(cls).items()):
+        if not isinstance(field, BaseField) or field in _originals:
+            continue
+
+        originals = {}
+        for method_name, event in EVENTS.items():
+            if not hasattr(field, method_name):
+                continue
+            originals[method_name] = field.__dict__.get(method_name, NotSet)
+            setattr(field, method_name, _instrumented(
+                getattr(field, method_name), event, cls.__name__, name))
+        _originals[field] = originals
+
+
+def _restore_all():
+    for field, originals in list(_originals.items()):
+        for method_name, original in originals.items():
+            if original is NotSet:
+                delattr(field, method_name)
+            else:
+                setattr(field, method_name, original)
+    _originals.clear()
+
+
+def _instrumented(method, event, model_name, field_name):
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            for listener in _listeners:
+                listener(event, model_name, field_name, duration)
+
+    return wrapper
@@ -0,0 +1,103 @@
+"""Accounting of memory used by models.
+
+Values of fields are not kept in models themselves, but in storage of each
+field (`field.memory`), keyed by `_cache_key` of model. Functions here sum
+sizes of models together with their values and report how much is held in
+storage of fields, including entries, which outlived their models (as
+something still keeps their `_cache_key`).
+
+Sizes are approximate - they come from `sys.getsizeof`, objects shared with
+other structures are counted as well.
+
+"""
+
+import gc
+import sys
+from collections import namedtuple
+
+from .fields import NotSet, _is_model
+
+ModelUsage = namedtuple('ModelUsage', ['instances', 'bytes', 'fields'])
+FieldUsage = namedtuple('FieldUsage', ['entries', 'orphaned', 'bytes'])
+
+
+def sizeof(model, deep=True):
+    """Get size of model in bytes, including values of its fields.
+
+    :param model: Model instance.
+    :param bool deep: If `True` sizes of values are counted recursively
+        (with embedded models), otherwise only sizes of top level values.
+    :rtype: `int`
+
+    """
+    return _model_size(model, deep, set())
+
+
+def usage(cls):
+    """Report memory used by live instances of model class.
+
+    Values of fields are reported for each field storage (which is shared
+    with subclasses, as fields are). Entries of storage, that don't belong
+    to any live instance, are counted as `orphaned` - they mean something
+    still keeps `_cache_key` of gone model.
+
+    :param cls: Model class.
+    :rtype: `ModelUsage`
+
+    """
+    instances = [obj for obj in gc.get_objects() if isinstance(obj, cls)]
+    live_keys = set(id(instance._cache_key) for instance in instances)
+
+    fields = {}
+    for name, field in cls.iterate_over_fields():
+        seen = set()
+        entries = list(field.memory.items())
+        fields[name] = FieldUsage(
+            entries=len(entries),
+            orphaned=sum(
+                1 for key, _ in entries if id(key) not in live_keys),
+            bytes=sum(_deep_size(value, seen) for _, value in entries),
+        )
+
+    size = sum(_own_size(instance) for instance in instances)
+    size += sum(field.bytes for field in fields.values())
+    return ModelUsage(len(instances), size, fields)
+
+
+def _own_size(model):
+    attributes = vars(model)
+    size = sys.getsizeof(model) + sys.getsizeof(attributes)
+    return size + sum(sys.getsizeof(value) for value in attributes.values())
+
+
+def _model_size(model, deep, seen):
+    seen.add(id(model))
+    size = _own_size(model)
+    key = model._cache_key
+    for _, field in model:
+        value = field.memory.get(key, NotSet)
+        if value is NotSet:
+            continue
+        if deep:
+            size += _deep_size(value, seen)
+        else:
+            size += sys.getsizeof(value)
+    return size
+
+
+def _deep_size(value, seen):
+    if id(value) in seen:
+        return 0
+    if _is_model(value):
+        return _model_size(value, True, seen)
+
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            _deep_size(key, seen) + _deep_size(item, seen)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in value)
+    return size
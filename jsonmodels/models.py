@@ -1,15 +1,30 @@
+import asyncio
+import copy
+import itertools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
 import six
 
-from . import parsers, errors
-from .fields import BaseField
-from .errors import FieldValidationError, ValidatorError, ValidationError
+from . import cache, parsers, errors, instrumentation
+from .collections import FrozenDict
+from .fields import BaseField, NotSet, ParseCache, structure_key
+from .errors import FieldValidationError, ValidatorError, ValidationError, \
+    FrozenModelError
+
+# Single difference between models. Path is tuple of structure names, list
+# indexes and map keys leading to value. `NotSet` marks missing value (e.g.
+# when list got longer).
+Change = namedtuple('Change', ['path', 'old', 'new'])
 
 
 class JsonmodelMeta(type):
 
     def __new__(cls, name, bases, attributes):
         cls.validate_fields(attributes)
-        return super(cls, cls).__new__(cls, name, bases, attributes)
+        model = super(cls, cls).__new__(cls, name, bases, attributes)
+        instrumentation.instrument_model(model)
+        return model
 
     @staticmethod
     def validate_fields(attributes):
@@ -24,34 +39,210 @@ class JsonmodelMeta(type):
                 raise ValueError('Name taken', structure_name, name)
             taken_names.add(structure_name)
 
+    def __setattr__(cls, name, value):
+        replaces_field = _is_field_name(cls, name)
+        super(JsonmodelMeta, cls).__setattr__(name, value)
+        if replaces_field or isinstance(value, BaseField):
+            _clear_field_tables(cls)
+        if isinstance(value, BaseField):
+            instrumentation.instrument_model(cls)
+
+    def __delattr__(cls, name):
+        removes_field = _is_field_name(cls, name)
+        super(JsonmodelMeta, cls).__delattr__(name)
+        if removes_field:
+            _clear_field_tables(cls)
+
+
+def _is_field_name(cls, name):
+    return any(
+        isinstance(klass.__dict__.get(name), BaseField)
+        for klass in cls.__mro__
+    )
+
+
+def _clear_field_tables(cls):
+    cache.forget_schemas()
+    if '_field_table' in cls.__dict__:
+        type.__delattr__(cls, '_field_table')
+    for subclass in cls.__subclasses__():
+        _clear_field_tables(subclass)
+
 
 class Base(six.with_metaclass(JsonmodelMeta, object)):
 
     """Base class for all models."""
 
+    # Limits of representation, longer collections and deeper structures
+    # are shortened.
+    repr_max_items = 10
+    repr_max_depth = 3
+
     def __init__(self, **kwargs):
         self._cache_key = _CacheKey()
         self.populate(**kwargs)
 
+    @classmethod
+    def construct(cls, **values):
+        """Create model from trusted values, skipping parsing and validation.
+
+        Values must already be in form fields keep them in (e.g. instances
+        of models for embedded fields), like values of other model or data
+        loaded from own storage. Non-existing fields are skipped.
+
+        """
+        instance = cls.__new__(cls)
+        instance._cache_key = _CacheKey()
+        for field, _, value in cls._match_fields(values):
+            field._store(instance, value)
+        return instance
+
+    @classmethod
+    def from_struct(cls, struct):
+        """Create model from Python structure (e.g. loaded from JSON)."""
+        return cls(**struct)
+
+    @classmethod
+    async def from_struct_async(cls, struct, chunk_size=1000):
+        """Create model from Python structure, yielding to event loop.
+
+        Big lists and maps are parsed and validated in chunks of
+        `chunk_size` items, and control is given back to event loop after
+        each chunk, so other tasks are not starved.
+
+        """
+        values = {}
+        for field, name, value in cls._match_fields(struct):
+            field._finish_initialization(cls)
+            try:
+                value = await field._parse_value_async(value, chunk_size)
+                await field._validate_async(value, chunk_size)
+            except ValidatorError as error:
+                raise FieldValidationError(cls.__name__, name, value, error)
+            values[name] = value
+        return cls.construct(**values)
+
+    @classmethod
+    def parse_many_parallel(cls, structs, workers=None, chunksize=1000,
+                            errors_only=False):
+        """Create and validate models from structures in pool of processes.
+
+        Structures are sent to worker processes in chunks, models are sent
+        back pickled. Model class must be importable by workers.
+
+        :param structs: Iterable of structures (e.g. loaded from JSON).
+        :param int workers: Number of processes (defaults to number of CPUs),
+            with `1` all is done in current process.
+        :param int chunksize: Number of structures sent to worker at once.
+        :param bool errors_only: If `True` only validation errors are sent
+            back, as list of `(index, error)` tuples, otherwise first
+            validation error is raised.
+        :rtype: `list`
+
+        """
+        chunks = _chunks(structs, chunksize)
+        if workers == 1:
+            results = (
+                _parse_chunk(cls, start, chunk, errors_only)
+                for start, chunk in chunks
+            )
+            return list(itertools.chain.from_iterable(results))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_parse_chunk, cls, start, chunk, errors_only)
+                for start, chunk in chunks
+            ]
+            return list(itertools.chain.from_iterable(
+                future.result() for future in futures))
+
     def populate(self, **values):
         """Populate values to fields. Skip non-existing."""
+        for field, name, value in self._match_fields(values):
+            self.set_field(field, name, value)
+
+    @classmethod
+    def _match_fields(cls, values):
+        """Match given values to fields.
+
+        Format is `(field_instance, name, value)`, where name is structure
+        name or attribute name, whichever was used in values.
+        """
         values = values.copy()
-        fields = list(self.iterate_with_name())
+        fields = list(cls.iterate_with_name())
         for _, structure_name, field in fields:
             if structure_name in values:
-                self.set_field(field, structure_name,
-                               values.pop(structure_name))
+                yield field, structure_name, values.pop(structure_name)
         for name, _, field in fields:
             if name in values:
-                self.set_field(field, name, values.pop(name))
+                yield field, name, values.pop(name)
 
-    def get_field(self, field_name):
+    @classmethod
+    def get_field(cls, field_name):
         """Get field associated with given attribute."""
-        for attr_name, field in self:
-            if field_name == attr_name:
-                return field
+        try:
+            return cls._get_field_table().by_attribute[field_name]
+        except KeyError:
+            raise errors.FieldNotFound(field_name)
 
-        raise errors.FieldNotFound(field_name)
+    @classmethod
+    def get_field_by_structure_name(cls, structure_name):
+        """Get field seen under given name in structure."""
+        try:
+            return cls._get_field_table().by_structure_name[structure_name]
+        except KeyError:
+            raise errors.FieldNotFound(structure_name)
+
+    @classmethod
+    def _get_field_table(cls):
+        table = cls.__dict__.get('_field_table')
+        if table is None:
+            table = cls._field_table = _FieldTable(cls)
+        return table
+
+    def apply_patch(self, patch):
+        """Apply JSON merge patch (RFC 7386) to model.
+
+        Only patched fields are parsed and validated, others are left as they
+        are. Embedded models and maps are merged (into copies), other values
+        (including lists) are replaced and `None` clears value. Patch is not
+        applied atomically - fields patched before error keep new values, the
+        field which failed is left untouched.
+
+        :param dict patch: Merge patch, keyed like values in `populate`.
+
+        """
+        key = self._cache_key
+        for field, name, value in self._match_fields(patch):
+            if value is None:
+                self.set_field(field, name, None)
+                continue
+
+            current = field.memory.get(key, NotSet)
+            if current is NotSet:
+                current = field.get_default_value() \
+                    if field.has_default else None
+            try:
+                field._store(self, field._merge_patch(current, value))
+            except ValidatorError as error:
+                raise FieldValidationError(type(self).__name__, name,
+                                           value, error)
+
+    def diff(self, other):
+        """Compare model with other one of the same type.
+
+        Values are compared directly (without casting to structures), values
+        which are the same objects are skipped.
+
+        :rtype: `list` of :class:`Change`
+
+        """
+        if type(other) is not type(self):
+            raise TypeError('Models of different types cannot be compared.',
+                            type(self).__name__, type(other).__name__)
+        changes = []
+        _diff_models((), self, other, changes)
+        return changes
 
     def set_field(self, field, field_name, value):
         """ Sets the value of a field. """
@@ -61,6 +252,82 @@ class Base(six.with_metaclass(JsonmodelMeta, object)):
             raise FieldValidationError(type(self).__name__, field_name,
                                        value, error)
 
+    def clone(self, deep=True, **overrides):
+        """Copy model, optionally overriding some values.
+
+        Copied values are not parsed nor validated again, immutable values
+        (like strings, numbers, dates or frozen models) are shared. Overrides
+        are set like in `populate`.
+
+        :param bool deep: Whether to copy mutable values (like lists, dicts
+            and models) too, or to share them.
+
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        clone.__dict__.update(self._extra_attributes())
+        clone._cache_key = _CacheKey()
+        clone.populate(**overrides)
+
+        key = self._cache_key
+        for _, field in self:
+            if clone._cache_key in field.memory:
+                continue
+            value = field.memory.get(key, NotSet)
+            if value is NotSet:
+                continue
+            field._store(clone, field._copy_value(value) if deep else value)
+        return clone
+
+    def __getstate__(self):
+        """Get values of fields, in order of fields of model class.
+
+        Other attributes of instance (if there are any) follow as `dict`.
+
+        """
+        key = self._cache_key
+        state = tuple(
+            field._to_state(field.memory.get(key, NotSet))
+            for _, _, field in self._get_field_table().fields
+        )
+        extra = self._extra_attributes()
+        return state + (extra,) if extra else state
+
+    def __setstate__(self, state):
+        fields = self._get_field_table().fields
+        if len(state) == len(fields) + 1:
+            self.__dict__.update(state[-1])
+            state = state[:-1]
+        if len(state) != len(fields):
+            raise ValueError(
+                "State doesn't match fields of model.", type(self).__name__)
+
+        self._cache_key = _CacheKey()
+        for (_, _, field), value in zip(fields, state):
+            if value is not NotSet:
+                field._store(self, field._from_state(value))
+
+    def __reduce__(self):
+        return _restore_model, (type(self), self.__getstate__())
+
+    def _extra_attributes(self):
+        """Get attributes of instance, which are not kept by fields."""
+        return {
+            name: value for name, value in vars(self).items()
+            if name not in _INTERNAL_ATTRIBUTES
+        }
+
+    def __copy__(self):
+        return self.clone(deep=False)
+
+    def __deepcopy__(self, memo):
+        clone = self.clone()
+        if clone is not self:
+            memo[id(self)] = clone
+            clone.__dict__.update(
+                copy.deepcopy(self._extra_attributes(), memo))
+        return clone
+
     def __iter__(self):
         """Iterate through fields and values."""
         for name, field in self.iterate_over_fields():
@@ -76,13 +343,60 @@ class Base(six.with_metaclass(JsonmodelMeta, object)):
                 raise FieldValidationError(type(self).__name__, name,
                                            value, error)
 
+    async def validate_async(self, concurrency=10, chunk_size=1000):
+        """Validate all the fields, including asynchronous validators.
+
+        Synchronous validation is done first (yielding to event loop after
+        each `chunk_size` items of lists and maps), then asynchronous
+        validators of all fields (and embedded models) are run concurrently.
+        Once any of them fails, the others are cancelled.
+
+        :param int concurrency: Maximal number of validators run at once.
+        :param int chunk_size: Number of items validated between yields.
+
+        """
+        await self._validate_chunked(chunk_size)
+
+        checks = []
+        self._collect_async_checks(checks)
+        if not checks:
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [
+            asyncio.ensure_future(_run_async_check(semaphore, *check))
+            for check in checks
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _validate_chunked(self, chunk_size):
+        for name, field in self:
+            value = field.__get__(self)
+            try:
+                await field._validate_async(value, chunk_size)
+            except ValidatorError as error:
+                raise FieldValidationError(type(self).__name__, name,
+                                           value, error)
+
+    def _collect_async_checks(self, checks):
+        model_name = type(self).__name__
+        for name, field in self:
+            for check in field._async_checks(field._peek(self)):
+                if isinstance(check, Base):
+                    check._collect_async_checks(checks)
+                else:
+                    checks.append((model_name, name) + check)
+
     @classmethod
     def iterate_over_fields(cls):
         """Iterate through fields as `(attribute_name, field_instance)`."""
-        for attr in dir(cls):
-            class_attribute = getattr(cls, attr)
-            if isinstance(class_attribute, BaseField):
-                yield attr, class_attribute
+        for attr_name, _, field in cls._get_field_table().fields:
+            yield attr_name, field
 
     @classmethod
     def iterate_with_name(cls):
@@ -92,35 +406,44 @@ class Base(six.with_metaclass(JsonmodelMeta, object)):
         Structure name is name under which value is seen in structure and
         schema (in primitives) and only there.
         """
-        for attr_name, field in cls.iterate_over_fields():
-            structure_name = field.structure_name(attr_name)
-            yield attr_name, structure_name, field
+        return iter(cls._get_field_table().fields)
 
     def to_struct(self):
         """Cast model to Python structure."""
         return parsers.to_struct(self)
 
+    async def to_struct_async(self, chunk_size=1000, executor=None):
+        """Cast model to Python structure, yielding to event loop.
+
+        Lists and maps are validated and cast in chunks of `chunk_size`
+        items, with control given back to event loop after each chunk.
+        If `executor` is given, whole casting is done in it instead.
+
+        """
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self.to_struct)
+
+        await self._validate_chunked(chunk_size)
+        resp = {}
+        for _, name, field in self.iterate_with_name():
+            value = field.__get__(self)
+            if value is None:
+                continue
+
+            value = await field._to_struct_async(value, chunk_size)
+            if value is not None:
+                resp[name] = value
+        return resp
+
     @classmethod
     def to_json_schema(cls):
         """Generate JSON schema for model."""
         return parsers.to_json_schema(cls)
 
     def __repr__(self):
-        attrs = {}
-        for name, _ in self:
-            try:
-                attr = getattr(self, name)
-                if attr is not None:
-                    attrs[name] = repr(attr)
-            except ValidationError:
-                pass
-
-        return '{class_name}({fields})'.format(
-            class_name=self.__class__.__name__,
-            fields=', '.join(
-                '{0[0]}={0[1]}'.format(x) for x in sorted(attrs.items())
-            ),
-        )
+        return _ReprBuilder(self.repr_max_items, self.repr_max_depth).model(
+            self, 0)
 
     def __str__(self):
         return '{name} object'.format(name=self.__class__.__name__)
@@ -156,5 +479,316 @@ class Base(six.with_metaclass(JsonmodelMeta, object)):
         return not (self == other)
 
 
+class FrozenBase(Base):
+
+    """Base class for immutable models.
+
+    Values can be given only during construction, later fields can't be
+    set anymore. Values of list fields are kept as tuples. Frozen models are
+    hashable (as long as their values are), so they can be used as dict keys
+    and set members.
+
+    Set `intern_size` to keep up to that many instances created with
+    `from_struct` (used by embedded and list fields) - the same structure
+    then gives the same instance, least recently used ones are dropped.
+
+    """
+
+    intern_size = 0
+
+    def __init__(self, **kwargs):
+        super(FrozenBase, self).__init__(**kwargs)
+        self._freeze()
+
+    @classmethod
+    def construct(cls, **values):
+        instance = super(FrozenBase, cls).construct(**values)
+        instance._freeze()
+        return instance
+
+    @classmethod
+    def from_struct(cls, struct):
+        if not cls.intern_size:
+            return super(FrozenBase, cls).from_struct(struct)
+
+        table = cls._get_intern_table()
+        try:
+            key = structure_key(struct)
+            instance = table.get(key)
+        except TypeError:
+            return super(FrozenBase, cls).from_struct(struct)
+
+        if instance is NotSet:
+            instance = super(FrozenBase, cls).from_struct(struct)
+            table.set(key, instance)
+        return instance
+
+    @classmethod
+    def _get_intern_table(cls):
+        table = cls.__dict__.get('_intern_table')
+        if table is None:
+            table = cls._intern_table = ParseCache(cls.intern_size)
+        return table
+
+    def _freeze(self):
+        """Install all defaults, freeze containers and remember values."""
+        key = self._cache_key
+        values = []
+        for _, field in self:
+            if key not in field.memory:
+                field._store(self, field.get_default_value())
+            value = field.memory[key]
+            frozen = _frozen(value)
+            if frozen is not value:
+                field._store(self, frozen)
+            values.append(frozen)
+        self._values = tuple(values)
+
+    def clone(self, deep=True, **overrides):
+        if not overrides:
+            # Immutable, so it can be shared.
+            return self
+        clone = super(FrozenBase, self).clone(deep=False, **overrides)
+        clone._freeze()
+        return clone
+
+    def apply_patch(self, patch):
+        for _, name, _ in self._match_fields(patch):
+            raise FrozenModelError(type(self).__name__, name)
+
+    def set_field(self, field, field_name, value):
+        if '_values' in self.__dict__:
+            raise FrozenModelError(type(self).__name__, field_name)
+        super(FrozenBase, self).set_field(field, field_name, value)
+
+    def __setstate__(self, state):
+        super(FrozenBase, self).__setstate__(state)
+        self._freeze()
+
+    def __setattr__(self, name, value):
+        if isinstance(getattr(type(self), name, None), BaseField):
+            raise FrozenModelError(type(self).__name__, name)
+        super(FrozenBase, self).__setattr__(name, value)
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((type(self), _hashable(self._values)))
+            return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+        try:
+            if hash(self) != hash(other):
+                return False
+        except TypeError:
+            # Some values (like non-frozen models) are unhashable.
+            pass
+        return self._values == other._values
+
+
+def _frozen(value):
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    if isinstance(value, dict) and not isinstance(value, FrozenDict):
+        return FrozenDict(
+            (key, _frozen(item)) for key, item in value.items())
+    return value
+
+
+def _hashable(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset(
+            (key, _hashable(item)) for key, item in value.items())
+    return value
+
+
+async def _run_async_check(semaphore, model_name, field_name, validator,
+                           value):
+    async with semaphore:
+        try:
+            await validator(value)
+        except ValidatorError as error:
+            raise FieldValidationError(model_name, field_name, value, error)
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    start = 0
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield start, chunk
+        start += len(chunk)
+        chunk = list(itertools.islice(iterator, size))
+
+
+def _parse_chunk(cls, start, structs, errors_only):
+    """Create and validate models, or only find errors if `errors_only`."""
+    if not errors_only:
+        models = [cls.from_struct(struct) for struct in structs]
+        for model in models:
+            model.validate()
+        return models
+
+    errors = []
+    for index, struct in enumerate(structs, start):
+        try:
+            cls.from_struct(struct).validate()
+        except ValidationError as error:
+            errors.append((index, error))
+    return errors
+
+
+_INTERNAL_ATTRIBUTES = frozenset(['_cache_key', '_values', '_hash'])
+
+
+def _restore_model(cls, state):
+    """Recreate model from pickled state."""
+    instance = cls.__new__(cls)
+    instance.__setstate__(state)
+    return instance
+
+
+def _diff_values(path, old, new, changes):
+    if old is new:
+        return
+
+    if isinstance(old, Base) and type(old) is type(new):
+        _diff_models(path, old, new, changes)
+    elif isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        _diff_lists(path, old, new, changes)
+    elif isinstance(old, dict) and isinstance(new, dict):
+        _diff_dicts(path, old, new, changes)
+    elif old != new:
+        changes.append(Change(path, old, new))
+
+
+def _diff_models(path, old, new, changes):
+    if isinstance(old, FrozenBase) and old == new:
+        return
+    for _, name, field in old.iterate_with_name():
+        _diff_values(
+            path + (name,), field._peek(old), field._peek(new), changes)
+
+
+def _diff_lists(path, old, new, changes):
+    for index, (old_item, new_item) in enumerate(zip(old, new)):
+        _diff_values(path + (index,), old_item, new_item, changes)
+    for index in range(len(new), len(old)):
+        changes.append(Change(path + (index,), old[index], NotSet))
+    for index in range(len(old), len(new)):
+        changes.append(Change(path + (index,), NotSet, new[index]))
+
+
+def _diff_dicts(path, old, new, changes):
+    for key, old_item in old.items():
+        new_item = new.get(key, NotSet)
+        if new_item is NotSet:
+            changes.append(Change(path + (key,), old_item, NotSet))
+        else:
+            _diff_values(path + (key,), old_item, new_item, changes)
+    for key, new_item in new.items():
+        if key not in old:
+            changes.append(Change(path + (key,), NotSet, new_item))
+
+
+class _FieldTable(object):
+
+    """Fields of model class, collected once and kept on the class.
+
+    Tables are dropped when fields of class (or its parents) are changed.
+
+    """
+
+    def __init__(self, cls):
+        fields = []
+        for attr_name in dir(cls):
+            attribute = getattr(cls, attr_name)
+            if isinstance(attribute, BaseField):
+                structure_name = attribute.structure_name(attr_name)
+                fields.append((attr_name, structure_name, attribute))
+
+        self.fields = tuple(fields)
+        self.by_attribute = dict(
+            (attr_name, field) for attr_name, _, field in fields)
+        self.by_structure_name = dict(
+            (structure_name, field) for _, structure_name, field in fields)
+
+
+class _ReprBuilder(object):
+
+    """Build representation of model from stored values.
+
+    Defaults are not installed nor validated, omitted items are never
+    represented.
+
+    """
+
+    def __init__(self, max_items, max_depth):
+        self.max_items = max_items
+        self.max_depth = max_depth
+
+    def model(self, model, depth):
+        name = type(model).__name__
+        if depth >= self.max_depth:
+            return name + '(...)'
+
+        key = model._cache_key
+        attrs = []
+        for attr_name, field in model.iterate_over_fields():
+            value = field.memory.get(key, field._default)
+            if value is not None and value is not NotSet:
+                attrs.append('{}={}'.format(
+                    attr_name, self.value(value, depth + 1)))
+        return '{}({})'.format(name, ', '.join(attrs))
+
+    def value(self, value, depth):
+        if isinstance(value, Base):
+            return self.model(value, depth)
+        if isinstance(value, dict):
+            return self.items(
+                '{', '}', value.items(), len(value), depth, self.pair)
+        if isinstance(value, tuple):
+            return self.items('(', ')', value, len(value), depth, self.value)
+        if isinstance(value, list):
+            return self.items('[', ']', value, len(value), depth, self.value)
+        if isinstance(value, (set, frozenset)) and value:
+            return self.set(value, depth)
+        return repr(value)
+
+    def set(self, value, depth):
+        opening, closing = '{', '}'
+        if isinstance(value, frozenset):
+            opening, closing = 'frozenset({', '})'
+        return self.items(
+            opening, closing, value, len(value), depth, self.value)
+
+    def pair(self, item, depth):
+        return '{}: {}'.format(
+            self.value(item[0], depth), self.value(item[1], depth))
+
+    def items(self, opening, closing, items, length, depth, represent):
+        if not length:
+            return opening + closing
+        if depth >= self.max_depth:
+            return opening + '...' + closing
+
+        parts = [
+            represent(item, depth + 1)
+            for item in itertools.islice(items, self.max_items)
+        ]
+        if length > self.max_items:
+            parts.append('... ({} more)'.format(length - self.max_items))
+        return opening + ', '.join(parts) + closing
+
+
 class _CacheKey(object):
     """Object to identify model in memory."""
@@ -1,7 +1,12 @@
 """Parsers to change model structure into different ones."""
+import hashlib
 import inspect
+import json
+import keyword
+import re
+import threading
 
-from . import fields, builders, errors
+from . import fields, builders, cache, errors, validators
 
 
 def to_struct(model):
@@ -32,6 +37,10 @@ def to_json_schema(cls):
     :rtype: ``dict``
 
     """
+    return cache.get_schema(cls, _build_json_schema)
+
+
+def _build_json_schema(cls):
     builder = build_json_schema(cls)
     return builder.build()
 
@@ -58,6 +67,8 @@ def build_json_schema_object(cls, parent_builder=None):
         elif isinstance(field, fields.MapField):
             builder.add_field(name, field, _create_primitive_field_schema(
                 fields.GenericField()))
+        elif isinstance(field, fields.SetField):
+            builder.add_field(name, field, _parse_set(field, builder))
         else:
             builder.add_field(
                 name, field, _create_primitive_field_schema(field))
@@ -66,15 +77,32 @@ def build_json_schema_object(cls, parent_builder=None):
 
 def _parse_list(field, parent_builder):
     builder = builders.ListBuilder(
-        parent_builder, field.nullable, default=field._default)
+        parent_builder, field.nullable, default=_get_default(field))
     for type in field.items_types:
         builder.add_type_schema(build_json_schema(type, builder))
     return builder.build()
 
 
+def _parse_set(field, parent_builder):
+    item_field = field.item_field
+    if isinstance(item_field, fields.EmbeddedField):
+        items = _parse_embedded(item_field, parent_builder)
+    else:
+        items = _create_primitive_field_schema(item_field)
+
+    schema = {
+        'type': ['array', 'null'] if field.nullable else 'array',
+        'uniqueItems': True,
+        'items': items,
+    }
+    if field.has_default:
+        schema['default'] = field.to_struct(field.get_default_value())
+    return schema
+
+
 def _parse_embedded(field, parent_builder):
     builder = builders.EmbeddedBuilder(
-        parent_builder, field.nullable, default=field._default)
+        parent_builder, field.nullable, default=_get_default(field))
     for type in field.types:
         builder.add_type_schema(build_json_schema(type, builder))
     return builder.build()
@@ -96,11 +124,15 @@ def _create_primitive_field_schema(field):
         schema['format'] = 'date-time'
 
     if field.has_default:
-        schema["default"] = field._default
+        schema["default"] = field.get_default_value()
 
     return schema
 
 
+def _get_default(field):
+    return field.get_default_value() if field.has_default else fields.NotSet
+
+
 def _get_schema_type(field):
     if isinstance(field, fields.StringField):
         obj_type = 'string'
@@ -117,3 +149,246 @@ def _get_schema_type(field):
     if field.nullable:
         obj_type = [obj_type, 'null']
     return obj_type
+
+
+_generated_models = {}
+_generated_models_lock = threading.Lock()
+
+
+def models_from_json_schema(schema, name='Model'):
+    """Generate model classes from JSON schema.
+
+    This is the reverse of `to_json_schema`. Objects become models (with
+    `title` or given name, or name of definition), references to
+    definitions (also circular ones) are resolved, known keywords are turned
+    into validators. Generated classes are cached by content of schema, so
+    generating them again from the same schema is free.
+
+    :param dict schema: JSON schema of object.
+    :param str name: Name of root model, when schema has no `title`.
+    :return: Root model class.
+    :raises ValueError: When name of property can't be name of field (e.g.
+        has spaces or dots).
+
+    """
+    key = hashlib.sha256(json.dumps(
+        [schema, name], sort_keys=True).encode('utf-8')).hexdigest()
+    with _generated_models_lock:
+        model = _generated_models.get(key)
+        if model is None:
+            factory = _ModelFactory(schema)
+            model = factory.model(schema.get('title', name), schema, '#')
+            _generated_models[key] = model
+    return model
+
+
+_PRIMITIVE_FIELDS = {
+    ('string', None): fields.StringField,
+    ('string', 'date'): fields.DateField,
+    ('string', 'date-time'): fields.DateTimeField,
+    ('string', 'time'): fields.TimeField,
+    ('integer', None): fields.IntField,
+    ('number', None): fields.FloatField,
+    ('number', 'float'): fields.FloatField,
+    ('boolean', None): fields.BoolField,
+}
+
+_PRIMITIVE_TYPES = {
+    'string': (str,),
+    'integer': (int,),
+    'number': (int, float),
+    'boolean': (bool,),
+}
+
+
+class _ModelFactory(object):
+
+    def __init__(self, root):
+        self.root = root
+        self.models = {}
+
+    def resolve(self, schema):
+        """Follow reference, giving `(schema, reference)`."""
+        if isinstance(schema, dict):
+            reference = schema.get('$ref')
+        else:
+            reference = schema
+        if reference is None:
+            return schema, None
+
+        resolved = self.root
+        for part in reference.lstrip('#').split('/')[1:]:
+            resolved = resolved[part.replace('~1', '/').replace('~0', '~')]
+        return resolved, reference
+
+    def model(self, name, schema, reference=None):
+        if reference in self.models:
+            return self.models[reference]
+
+        from .models import Base
+
+        model = type(_class_name(name), (Base,), {})
+        if reference is not None:
+            self.models[reference] = model
+        required = schema.get('required', ())
+        taken = set()
+        for structure_name, field_schema in schema.get(
+                'properties', {}).items():
+            if not fields.is_valid_name(structure_name):
+                raise ValueError(
+                    'Property name can not be used as name of field',
+                    model.__name__, structure_name)
+            attribute_name = _attribute_name(structure_name, taken)
+            setattr(model, attribute_name, self.field(
+                field_schema, structure_name,
+                required=structure_name in required,
+                name=(structure_name
+                      if structure_name != attribute_name else None),
+                help_text=_get_description(field_schema),
+            ))
+        return model
+
+    def field(self, schema, model_name='Item', **kwargs):
+        schema, reference = self.resolve(schema)
+        types, nullable = _schema_types(schema)
+        kwargs['nullable'] = nullable
+        kwargs['validators'] = _schema_validators(schema)
+        if 'default' in schema:
+            kwargs['default'] = schema['default']
+
+        if 'array' in types and schema.get('uniqueItems') is True \
+                and isinstance(schema.get('items'), dict):
+            return _create_field(
+                fields.SetField, self.field(schema['items'], model_name),
+                **kwargs)
+        elif 'array' in types:
+            items = self.types(schema.get('items', {}), model_name)
+            kwargs['nullable'] = nullable or type(None) in items
+            return _create_field(
+                fields.ListField,
+                [type_ for type_ in items if type_ is not type(None)],
+                item_validators=_item_validators(schema),
+                **kwargs)
+        elif _is_object(schema) or 'oneOf' in schema:
+            return self.object_field(schema, reference, model_name, kwargs)
+
+        return _create_field(_primitive_field(
+            types[0] if types else None, schema.get('format')), **kwargs)
+
+    def object_field(self, schema, reference, model_name, kwargs):
+        types = self.types(reference or schema, model_name)
+        kwargs['nullable'] = kwargs['nullable'] or type(None) in types
+        models = [type_ for type_ in types if hasattr(type_, 'to_struct')]
+        if models:
+            return _create_field(fields.EmbeddedField, models, **kwargs)
+
+        values = schema.get('additionalProperties')
+        if isinstance(values, dict):
+            return _create_field(
+                fields.MapField, fields.StringField(), self.field(values),
+                **kwargs)
+        return _create_field(fields.GenericField, **kwargs)
+
+    def types(self, schema, model_name='Item'):
+        """Get Python types (models for objects) for values of schema."""
+        schema, reference = self.resolve(schema)
+        if 'oneOf' in schema:
+            result = []
+            for option in schema['oneOf']:
+                result.extend(
+                    type_ for type_ in self.types(option, model_name)
+                    if type_ not in result)
+            return result
+
+        types, nullable = _schema_types(schema)
+        result = [type(None)] if nullable else []
+        if schema.get('properties') is not None:
+            name = reference.split('/')[-1] if reference else model_name
+            return result + [self.model(
+                schema.get('title', name), schema, reference)]
+        for type_ in types:
+            result.extend(_PRIMITIVE_TYPES.get(type_, ()))
+        return result
+
+
+def _primitive_field(type_, format_):
+    """Get field class of type, ignoring unknown formats."""
+    field_class = _PRIMITIVE_FIELDS.get((type_, format_))
+    if field_class is None:
+        field_class = _PRIMITIVE_FIELDS.get((type_, None), fields.GenericField)
+    return field_class
+
+
+def _create_field(field_class, *args, **kwargs):
+    default = kwargs.pop('default', fields.NotSet)
+    if default is not fields.NotSet:
+        # Default comes as structure, so field must parse it first.
+        default = field_class(*args, **kwargs).parse_value(default)
+    return field_class(*args, default=default, **kwargs)
+
+
+def _schema_types(schema):
+    """Get JSON types of schema (without null) and if it is nullable."""
+    types = schema.get('type', [])
+    if not isinstance(types, list):
+        types = [types]
+    if 'oneOf' in schema:
+        types = types + [
+            option.get('type') for option in schema['oneOf']
+            if isinstance(option, dict) and 'type' in option]
+    return [type_ for type_ in types if type_ != 'null'], 'null' in types
+
+
+def _is_object(schema):
+    return 'object' in _schema_types(schema)[0] or 'properties' in schema
+
+
+def _get_description(schema):
+    return schema.get('description') if isinstance(schema, dict) else None
+
+
+def _schema_validators(schema):
+    result = []
+    for keyword_, exclusive, validator in (
+            ('minimum', 'exclusiveMinimum', validators.Min),
+            ('maximum', 'exclusiveMaximum', validators.Max)):
+        if keyword_ in schema:
+            result.append(validator(
+                schema[keyword_], schema.get(exclusive) is True))
+        elif isinstance(schema.get(exclusive), (int, float)):
+            result.append(validator(schema[exclusive], True))
+
+    if 'pattern' in schema:
+        result.append(validators.Regex(schema['pattern']))
+    minimum = schema.get('minLength', schema.get('minItems'))
+    maximum = schema.get('maxLength', schema.get('maxItems'))
+    if minimum is not None or maximum is not None:
+        result.append(validators.Length(minimum, maximum))
+    if 'enum' in schema:
+        result.append(validators.Enum(*schema['enum']))
+    return result
+
+
+def _item_validators(schema):
+    items = schema.get('items')
+    if isinstance(items, dict) and 'oneOf' not in items:
+        return _schema_validators(items)
+    return []
+
+
+def _class_name(name):
+    parts = re.split(r'[^0-9a-zA-Z]+', name)
+    return ''.join(part[:1].upper() + part[1:] for part in parts) or 'Model'
+
+
+def _attribute_name(structure_name, taken):
+    """Get unique attribute name for property, remembering it in `taken`."""
+    from .models import Base
+
+    name = re.sub(r'\W', '_', structure_name)
+    if not name or name[0].isdigit():
+        name = '_' + name
+    while keyword.iskeyword(name) or hasattr(Base, name) or name in taken:
+        name += '_'
+    taken.add(name)
+    return name
@@ -93,6 +93,27 @@ def compare_schemas(one, two):
             type=type(one).__name__))
 
 
+def merge_patch(target, patch):
+    """Apply JSON merge patch (RFC 7386) to Python structure.
+
+    Given target is not changed, patched structure is returned.
+
+    :param target: Structure to patch.
+    :param patch: Merge patch.
+
+    """
+    if not isinstance(patch, dict):
+        return patch
+
+    result = type(target)(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
 def is_ecma_regex(regex):
     """Check if given regex is of type ECMA 262 or not.
 
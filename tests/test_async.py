@@ -0,0 +1,200 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jsonmodels import models, fields, errors
+
+KNOWN_IDS = {'a', 'b', 'c'}
+
+
+class Tracker(object):
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.checked = []
+
+    async def validate(self, value):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        self.checked.append(value)
+        if value not in KNOWN_IDS:
+            raise errors.EnumError(value, sorted(KNOWN_IDS))
+
+
+def _models(tracker, sync_calls):
+
+    def sync_validator(value):
+        sync_calls.append(value)
+
+    class Reference(models.Base):
+
+        id = fields.StringField(validators=[tracker, sync_validator])
+
+    class Document(models.Base):
+
+        owner = fields.StringField(validators=tracker, nullable=True)
+        reference = fields.EmbeddedField(Reference)
+        references = fields.ListField(Reference)
+        tags = fields.ListField(str, item_validators=[tracker])
+        labels = fields.DerivedListField(fields.StringField(
+            validators=[tracker]))
+        named = fields.MapField(fields.StringField(), fields.EmbeddedField(
+            Reference))
+
+    return Document
+
+
+def test_validate_async():
+    tracker = Tracker()
+    sync_calls = []
+    Document = _models(tracker, sync_calls)
+
+    document = Document(
+        owner='a', reference={'id': 'b'}, references=[{'id': 'c'}],
+        tags=['a', 'b'], labels=['c'], named={'x': {'id': 'a'}},
+    )
+    assert tracker.checked == []
+
+    asyncio.run(document.validate_async(concurrency=3))
+
+    assert sorted(tracker.checked) == ['a', 'a', 'a', 'b', 'b', 'c', 'c']
+    assert tracker.max_running == 3
+    assert set(sync_calls) == KNOWN_IDS
+
+
+def test_validate_async_errors():
+    tracker = Tracker()
+    Document = _models(tracker, [])
+
+    with pytest.raises(errors.FieldValidationError) as info:
+        asyncio.run(Document(owner='x').validate_async())
+    assert info.value.field_name == 'owner'
+    assert isinstance(info.value.error, errors.EnumError)
+
+    with pytest.raises(errors.FieldValidationError) as info:
+        asyncio.run(Document(references=[{'id': 'x'}]).validate_async())
+    assert info.value.model_name == 'Reference'
+    assert info.value.field_name == 'id'
+
+    with pytest.raises(errors.ValidationError):
+        asyncio.run(Document(tags=['x']).validate_async())
+
+
+def test_validate_async_without_async_validators():
+
+    class Person(models.Base):
+
+        name = fields.StringField(required=True)
+
+    asyncio.run(Person(name='Chuck').validate_async())
+    with pytest.raises(errors.ValidationError):
+        asyncio.run(Person().validate_async())
+
+
+class Entry(models.Base):
+
+    name = fields.StringField()
+
+
+class Feed(models.Base):
+
+    title = fields.StringField(required=True)
+    entry = fields.EmbeddedField(Entry)
+    entries = fields.ListField(Entry)
+    ids = fields.DerivedListField(fields.IntField())
+    counts = fields.MapField(fields.StringField(), fields.IntField())
+
+
+FEED = {
+    'title': 'news',
+    'entry': {'name': 'first'},
+    'entries': [{'name': str(i)} for i in range(25)],
+    'ids': list(range(25)),
+    'counts': {str(i): i for i in range(25)},
+}
+
+
+def _run_with_ticker(coroutine):
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        try:
+            return await coroutine
+        finally:
+            task.cancel()
+
+    return asyncio.run(main()), len(ticks)
+
+
+def test_from_struct_async():
+    feed, ticks = _run_with_ticker(
+        Feed.from_struct_async(FEED, chunk_size=10))
+
+    assert feed.to_struct() == Feed(**FEED).to_struct()
+    assert isinstance(feed.entries[0], Entry)
+    assert ticks > 6
+
+    with pytest.raises(errors.FieldValidationError) as info:
+        asyncio.run(Feed.from_struct_async(dict(FEED, ids=[1, 'x'])))
+    assert info.value.field_name == 'ids'
+
+
+def test_to_struct_async():
+    feed = Feed(**FEED)
+
+    struct, ticks = _run_with_ticker(feed.to_struct_async(chunk_size=10))
+    assert struct == feed.to_struct()
+    assert ticks > 6
+
+    with pytest.raises(errors.ValidationError):
+        asyncio.run(Feed().to_struct_async())
+
+
+def test_to_struct_async_in_executor():
+    feed = Feed(**FEED)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await feed.to_struct_async(executor=executor)
+
+    assert asyncio.run(main()) == feed.to_struct()
+
+
+def test_validate_async_in_chunks():
+    feed = Feed(**FEED)
+    # Tuples are not collections validating their items on changes.
+    feed.entries = tuple(feed.entries)
+    feed.ids = tuple(feed.ids)
+    _, ticks = _run_with_ticker(feed.validate_async(chunk_size=5))
+    assert ticks > 8
+
+
+def test_callable_object_with_async_call():
+
+    class Checker(object):
+
+        async def __call__(self, value):
+            await asyncio.sleep(0)
+            if value not in KNOWN_IDS:
+                raise errors.EnumError(value, sorted(KNOWN_IDS))
+
+    class Document(models.Base):
+
+        owner = fields.StringField(validators=[Checker()], nullable=True)
+
+    document = Document(owner='x')
+    document.validate()
+    with pytest.raises(errors.FieldValidationError):
+        asyncio.run(document.validate_async())
+    asyncio.run(Document(owner='a').validate_async())
@@ -0,0 +1,102 @@
+import datetime
+import os
+
+import pytest
+
+from jsonmodels import models, fields, cache
+
+
+class Address(models.Base):
+
+    street = fields.StringField(required=True)
+
+
+class Person(models.Base):
+
+    name = fields.StringField()
+    addresses = fields.ListField(Address)
+    friends = fields.ListField(['Person'])
+
+
+class Event(models.Base):
+
+    start = fields.DateTimeField(default=datetime.datetime(2020, 1, 1))
+
+
+@pytest.fixture
+def cache_dir(tmpdir):
+    cache.enable(str(tmpdir))
+    yield str(tmpdir)
+    cache.disable()
+
+
+def _fail(cls):
+    raise AssertionError('Schema should come from cache.')
+
+
+def test_schema_cache(cache_dir):
+    schema = Person.to_json_schema()
+    assert len(os.listdir(cache_dir)) == 1
+
+    assert cache.get_schema(Person, _fail) == schema
+    assert Person.to_json_schema() == schema
+    assert Person.to_json_schema() is not Person.to_json_schema()
+
+    Address.to_json_schema()
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_schema_cache_key():
+    key = cache.model_key(Person)
+    assert key == cache.model_key(Person)
+    assert key != cache.model_key(Address)
+
+    class Local(models.Base):
+        name = fields.StringField()
+
+    class Referring(models.Base):
+        local = fields.EmbeddedField(Local)
+
+    assert cache.model_key(Local) is None
+    assert cache.model_key(Referring) is None
+
+
+def test_local_models_are_not_cached(cache_dir):
+
+    class Local(models.Base):
+        name = fields.StringField()
+
+    assert Local.to_json_schema()['properties'] == {
+        'name': {'type': 'string'}}
+    assert os.listdir(cache_dir) == []
+
+
+def test_broken_cache_is_regenerated(cache_dir):
+    schema = Person.to_json_schema()
+    path, = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, path), 'wb') as target:
+        target.write(b'broken')
+
+    assert Person.to_json_schema() == schema
+    assert cache.get_schema(Person, _fail) == schema
+
+
+def test_unmarshallable_schema_is_not_cached(cache_dir):
+    schema = Event.to_json_schema()
+    assert schema['properties']['start']['default'] == datetime.datetime(
+        2020, 1, 1)
+    assert os.listdir(cache_dir) == []
+
+
+def test_schemas_are_kept_in_memory(cache_dir):
+    schema = Person.to_json_schema()
+    os.remove(os.path.join(cache_dir, os.listdir(cache_dir)[0]))
+
+    assert cache.get_schema(Person, _fail) == schema
+    assert Person.to_json_schema() is not Person.to_json_schema()
+
+    Person.nickname = fields.StringField()
+    try:
+        assert 'nickname' in Person.to_json_schema()['properties']
+    finally:
+        del Person.nickname
@@ -0,0 +1,108 @@
+import copy
+import datetime
+
+import pytest
+
+from jsonmodels import models, fields, errors
+
+
+class Country(models.FrozenBase):
+
+    code = fields.StringField()
+
+
+class Address(models.Base):
+
+    street = fields.StringField()
+    country = fields.EmbeddedField(Country)
+
+
+class Person(models.Base):
+
+    name = fields.StringField(required=True)
+    born = fields.DateTimeField()
+    address = fields.EmbeddedField(Address)
+    tags = fields.ListField(str)
+    scores = fields.MapField(fields.StringField(), fields.IntField())
+
+
+def _person():
+    return Person(
+        name='John', born=datetime.datetime(2000, 1, 1), tags=['a'],
+        address={'street': 'Main', 'country': {'code': 'US'}},
+        scores={'math': 1},
+    )
+
+
+def test_clone():
+    person = _person()
+    clone = person.clone()
+
+    assert clone == person
+    assert clone.born is person.born
+    assert clone.address is not person.address
+    assert clone.address.country is person.address.country
+
+    clone.tags.append('b')
+    clone.scores['math'] = 2
+    clone.address.street = 'Elm'
+    assert person.tags == ['a']
+    assert person.scores == {'math': 1}
+    assert person.address.street == 'Main'
+    with pytest.raises(errors.ValidationError):
+        clone.tags.append(1)
+
+
+def test_shallow_clone():
+    person = _person()
+    clone = person.clone(deep=False)
+
+    assert clone.tags is person.tags
+    assert clone.address is person.address
+    assert copy.copy(person).tags is person.tags
+    assert copy.deepcopy(person).tags is not person.tags
+    assert copy.deepcopy(person) == person
+
+
+def test_clone_with_overrides():
+    person = _person()
+    clone = person.clone(name='Jane', tags=['c'])
+
+    assert clone.name == 'Jane'
+    assert clone.tags == ['c']
+    assert clone.scores == person.scores
+    assert person.name == 'John'
+
+    with pytest.raises(errors.ValidationError):
+        person.clone(name=None)
+
+
+def test_clone_frozen():
+    country = Country(code='US')
+
+    assert country.clone() is country
+    assert copy.deepcopy(country) is country
+
+    clone = country.clone(code='PL')
+    assert clone.code == 'PL'
+    with pytest.raises(errors.FrozenModelError):
+        clone.code = 'DE'
+
+
+def test_copy_keeps_other_attributes():
+
+    class Employee(Person):
+
+        def __init__(self, **kwargs):
+            super(Employee, self).__init__(**kwargs)
+            self.extra = {'badge': 1}
+
+    employee = Employee(name='John')
+    shallow = copy.copy(employee)
+    deep = copy.deepcopy(employee)
+
+    assert shallow.extra is employee.extra
+    assert deep.extra == employee.extra
+    assert deep.extra is not employee.extra
+    assert employee.clone(name='Bob').extra == {'badge': 1}
+    assert deep._cache_key is not employee._cache_key
@@ -390,3 +390,98 @@ def test_default_value():
     assert p.last_ate == default_last_ate
     assert p.birthday == default_birthday
     assert p.time_of_death == default_time_of_death
+
+
+def test_construct_skips_parsing_and_validation():
+
+    class Person(models.Base):
+
+        name = fields.StringField(required=True)
+        surname = fields.StringField(name='last_name')
+        age = fields.IntField()
+
+    person = Person.construct(name='Alan', last_name='Wake', age='24')
+    assert person.name == 'Alan'
+    assert person.surname == 'Wake'
+    assert person.age == '24'
+
+    with pytest.raises(FieldValidationError):
+        person.validate()
+
+    person = Person.construct(age=24)
+    with pytest.raises(errors.ValidationError):
+        person.validate()
+
+
+def test_default_is_not_validated_again():
+
+    calls = []
+
+    class Person(models.Base):
+
+        name = fields.StringField(
+            default='Alan', validators=[lambda value: calls.append(value)])
+
+    assert calls == ['Alan']
+    person = Person()
+    assert person.name == 'Alan'
+    assert calls == ['Alan']
+
+
+def test_mutable_default_values_are_not_shared():
+
+    class Job(models.Base):
+        title = fields.StringField()
+
+    class Person(models.Base):
+        job = fields.EmbeddedField(Job, default=Job(title='Unemployed'))
+        hobbies = fields.ListField(items_types=str, default=[])
+        jobs = fields.ListField(items_types=Job, default=[Job(title='Cook')])
+        skills = fields.MapField(
+            fields.StringField(), fields.IntField(), default={'cooking': 1})
+
+    first = Person()
+    second = Person()
+    first.job.title = 'Writer'
+    first.hobbies.append('reading')
+    first.jobs[0].title = 'Baker'
+    first.skills['cooking'] = 5
+
+    assert second.job.title == 'Unemployed'
+    assert second.hobbies == []
+    assert second.jobs[0].title == 'Cook'
+    assert second.skills == {'cooking': 1}
+    with pytest.raises(errors.ValidationError):
+        second.hobbies.append(42)
+
+
+def test_default_factory():
+
+    class Person(models.Base):
+        hobbies = fields.ListField(
+            items_types=str, default_factory=lambda: ['reading'])
+
+    first = Person()
+    first.hobbies.append('eating')
+    assert Person().hobbies == ['reading']
+    assert first.hobbies == ['reading', 'eating']
+    with pytest.raises(errors.ValidationError):
+        first.hobbies.append(42)
+    assert Person.to_json_schema()['properties']['hobbies']['default'] == [
+        'reading']
+
+    with pytest.raises(ValueError):
+        fields.StringField(default='', default_factory=str)
+    with pytest.raises(errors.ValidationError):
+        fields.StringField(default_factory=int)
+
+
+def test_default_factory_results_are_validated():
+    names = iter(['Alan', 'Alan', 42])
+
+    class Person(models.Base):
+        name = fields.StringField(default_factory=lambda: next(names))
+
+    assert Person().name == 'Alan'
+    with pytest.raises(errors.ValidationError):
+        Person().name
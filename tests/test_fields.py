@@ -97,9 +97,9 @@ def test_custom_field_validation():
         Person(surnames=[None])
 
     person = Person()
-    person.surnames.append(None)
-    with pytest.raises(errors.FieldValidationError):
-        person.validate()
+    with pytest.raises(errors.ValidationError):
+        person.surnames.append(None)
+    assert person.surnames == []
 
 
 def test_map_field():
@@ -224,3 +224,157 @@ def test_automatic_model_detection():
 
     with pytest.raises(errors.FieldValidationError):
         Person(names=[{'models': 1}])
+
+
+def test_parse_cache():
+
+    class Event(models.Base):
+        date = fields.DateTimeField(parse_cache_size=2)
+        tags = fields.ListField(str, parse_cache_size=2)
+        extra = fields.GenericField(parse_cache_size=2)
+
+    first = Event(date='2020-01-01T10:00:00', tags=['a'])
+    second = Event(date='2020-01-01T10:00:00', tags=['a'])
+    Event(date='2020-01-02T10:00:00')
+    Event(date='2020-01-03T10:00:00')
+
+    cache = Event.date.parse_cache
+    assert first.date is second.date
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(cache) == 2
+
+    first.tags.append('b')
+    assert second.tags == ['a']
+    assert Event.tags.parse_cache.hits == 1
+
+    assert Event(extra={1, 2}).extra == {1, 2}
+    assert len(Event.extra.parse_cache) == 0
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+    assert fields.StringField().parse_cache is None
+
+
+def test_parse_cache_keeps_types_of_containers():
+
+    class Event(models.Base):
+        tags = fields.ListField(str, parse_cache_size=2)
+        counts = fields.MapField(
+            fields.StringField(), fields.IntField(), parse_cache_size=2)
+
+    assert isinstance(Event(tags=('x',)).tags, tuple)
+    assert isinstance(Event(tags=['x']).tags, list)
+
+    Event(counts={'a': 1, 'b': 2})
+    counts = Event(counts=OrderedDict([('b', 2), ('a', 1)])).counts
+    assert isinstance(counts, OrderedDict)
+    assert list(counts) == ['b', 'a']
+
+
+def test_indexed_list_field():
+
+    class Item(models.Base):
+        sku = fields.StringField()
+        region = fields.StringField()
+
+    class Order(models.Base):
+        items = fields.IndexedListField(Item, index_by='sku')
+        prices = fields.IndexedListField(Item, index_by=('sku', 'region'))
+
+    order = Order(items=[{'sku': 'a'}, {'sku': 'b'}], prices=[
+        {'sku': 'a', 'region': 'eu'}, {'sku': 'a', 'region': 'us'}])
+    items = order.items
+    assert items.find('a').sku == 'a'
+    assert items.find('x') is None
+    assert order.prices.find('a', 'us').region == 'us'
+
+    items.append(Item(sku='c'))
+    items.insert(0, Item(sku='a', region='eu'))
+    assert [item.region for item in items.find_all('a')] == [None, 'eu']
+
+    items[1] = Item(sku='d')
+    assert items.find('a').region == 'eu'
+    assert items.find('d') is items[1]
+
+    del items[0]
+    assert items.find('a') is None
+    items.pop()
+    assert items.find('c') is None
+    items.remove(items.find('b'))
+    items.extend([Item(sku='e')])
+    items += [Item(sku='f')]
+    items[:1] = [Item(sku='g')]
+    assert [item.sku for item in items] == ['g', 'e', 'f']
+    assert items.find('d') is None
+    assert items.find('f') is items[2]
+
+    with pytest.raises(errors.ValidationError):
+        items.append('h')
+    assert order.to_struct()['items'] == [
+        {'sku': 'g'}, {'sku': 'e'}, {'sku': 'f'}]
+    assert Order.to_json_schema()['properties']['items']['type'] == 'array'
+
+    order.items = []
+    order.items.append(Item(sku='a'))
+    assert order.items.find('a') is order.items[0]
+
+    with pytest.raises(ValueError):
+        fields.IndexedListField(Item)
+
+
+def test_set_field():
+
+    class Tag(models.FrozenBase):
+        name = fields.StringField()
+
+    class Post(models.Base):
+        labels = fields.SetField(
+            fields.StringField(validators=validators.Length(maximum_value=5)),
+            required=True)
+        dates = fields.SetField(fields.DateTimeField(), nullable=True)
+        tags = fields.SetField(fields.EmbeddedField(Tag))
+        scores = fields.SetField(fields.IntField(), sort_key=lambda v: -v)
+
+    post = Post(labels=['b', 'a', 'b'],
+                dates=['2020-01-02T00:00:00', '2020-01-01T00:00:00'],
+                tags=[{'name': 'y'}, {'name': 'x'}, {'name': 'y'}],
+                scores=(1, 3, 2))
+    assert post.labels == {'a', 'b'}
+    assert 'a' in post.labels
+    assert len(post.tags) == 2
+
+    post.labels.add('c')
+    assert post.to_struct() == {
+        'labels': ['a', 'b', 'c'],
+        'dates': ['2020-01-01T00:00:00', '2020-01-02T00:00:00'],
+        'tags': [{'name': 'x'}, {'name': 'y'}],
+        'scores': [3, 2, 1],
+    }
+    assert Post.dates.toBsonEncodable(post.dates) == [
+        datetime.datetime(2020, 1, 1), datetime.datetime(2020, 1, 2)]
+
+    with pytest.raises(errors.ValidationError):
+        post.labels = ['toolong']
+    post.scores = frozenset([1, 2])
+    assert post.scores == {1, 2}
+    assert isinstance(post.scores, set)
+    with pytest.raises(errors.ValidationError):
+        post.scores = 5
+    with pytest.raises(errors.ValidationError):
+        fields.SetField(fields.GenericField()).parse_value([[1]])
+    assert Post().labels == set()
+    assert Post(dates=None).dates is None
+
+    schema = Post.to_json_schema()['properties']
+    assert schema['labels'] == {
+        'type': 'array', 'uniqueItems': True,
+        'items': {'type': 'string', 'maxLength': 5}}
+    assert schema['dates']['type'] == ['array', 'null']
+    assert schema['tags']['items']['type'] == 'object'
+
+    class Frozen(models.FrozenBase):
+        labels = fields.SetField(fields.StringField())
+
+    frozen = Frozen(labels=['a'])
+    assert frozen.labels == frozenset(['a'])
+    assert hash(frozen) == hash(Frozen(labels=['a']))
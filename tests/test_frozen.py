@@ -0,0 +1,137 @@
+import pytest
+
+from jsonmodels import models, fields, errors
+
+
+class Currency(models.FrozenBase):
+
+    code = fields.StringField(required=True)
+    rates = fields.ListField(float)
+
+
+class Price(models.FrozenBase):
+
+    amount = fields.FloatField()
+    currency = fields.EmbeddedField(Currency)
+    tags = fields.MapField(fields.StringField(), fields.StringField())
+
+
+def test_frozen_model_cannot_be_changed():
+    currency = Currency(code='EUR', rates=[1.0, 2.0])
+
+    with pytest.raises(errors.FrozenModelError):
+        currency.code = 'USD'
+    with pytest.raises(errors.FrozenModelError):
+        currency.populate(code='USD')
+    with pytest.raises(AttributeError):
+        currency.rates.append(3.0)
+
+    assert currency.code == 'EUR'
+    assert currency.rates == (1.0, 2.0)
+
+
+def test_frozen_model_equality_and_hash():
+    first = Price(amount=1.5, currency={'code': 'EUR'}, tags={'a': 'b'})
+    second = Price(amount=1.5, currency={'code': 'EUR'}, tags={'a': 'b'})
+    third = Price(amount=1.5, currency={'code': 'USD'}, tags={'a': 'b'})
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != third
+    assert len({first, second, third}) == 2
+    assert first.to_struct() == {
+        'amount': 1.5, 'currency': {'code': 'EUR', 'rates': []},
+        'tags': {'a': 'b'}}
+
+
+def test_frozen_model_construct():
+    currency = Currency.construct(code='EUR')
+
+    assert currency == Currency(code='EUR')
+    with pytest.raises(errors.FrozenModelError):
+        currency.code = 'USD'
+
+
+def test_frozen_model_validation():
+    currency = Currency()
+
+    with pytest.raises(errors.ValidationError):
+        currency.validate()
+
+
+class Unit(models.FrozenBase):
+
+    intern_size = 2
+
+    name = fields.StringField()
+    factor = fields.FloatField()
+
+
+class Measurement(models.Base):
+
+    unit = fields.EmbeddedField(Unit)
+    units = fields.ListField(Unit)
+
+
+def test_interning():
+    first = Measurement(unit={'name': 'kg', 'factor': 1})
+    second = Measurement(units=[{'name': 'kg', 'factor': 1}])
+    third = Measurement(unit={'name': 'kg', 'factor': 1.0})
+
+    assert first.unit is second.units[0]
+    assert first.unit is not third.unit
+    assert first.unit == third.unit
+
+    Unit.from_struct({'name': 'g'})
+    Unit.from_struct({'name': 'mg'})
+    assert Unit.from_struct({'name': 'kg', 'factor': 1}) is not first.unit
+
+
+def test_interning_is_per_class():
+    assert Price.intern_size == 0
+    assert '_intern_table' not in Price.__dict__
+    first = Price(currency={'code': 'EUR'})
+    second = Price(currency={'code': 'EUR'})
+    assert first.currency is not second.currency
+
+
+def test_frozen_model_dicts_cannot_be_changed():
+
+    class Settings(models.FrozenBase):
+        values = fields.MapField(fields.StringField(), fields.IntField())
+        extra = fields.GenericField()
+
+    settings = Settings(values={'a': 1}, extra={'b': [1, {'c': 2}]})
+    first_hash = hash(settings)
+
+    with pytest.raises(TypeError):
+        settings.values['a'] = 2
+    with pytest.raises(TypeError):
+        settings.values.update(b=2)
+    with pytest.raises(TypeError):
+        settings.extra['b'][1]['c'] = 3
+    with pytest.raises(AttributeError):
+        settings.extra['b'].append(3)
+
+    assert hash(settings) == first_hash
+    assert settings == Settings(values={'a': 1}, extra={'b': [1, {'c': 2}]})
+    assert settings != Settings(values={'a': 2})
+    assert settings.to_struct() == {'values': {'a': 1},
+                                    'extra': {'b': [1, {'c': 2}]}}
+    assert type(settings.to_struct()['values']) is dict
+    assert settings.clone(values={'a': 2}).values == {'a': 2}
+
+
+def test_frozen_model_with_unhashable_values_can_be_compared():
+
+    class Address(models.Base):
+        street = fields.StringField()
+
+    class Home(models.FrozenBase):
+        address = fields.EmbeddedField(Address)
+
+    first = Home(address={'street': 'Main'})
+    with pytest.raises(TypeError):
+        hash(first)
+    assert first == first
+    assert first != Home(address={'street': 'Elm'})
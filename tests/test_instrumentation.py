@@ -0,0 +1,103 @@
+from jsonmodels import models, fields, instrumentation
+from jsonmodels.parsers import models_from_json_schema
+
+
+class Address(models.Base):
+
+    street = fields.StringField()
+
+
+class Person(models.Base):
+
+    name = fields.StringField(required=True)
+    age = fields.IntField(default=18)
+    address = fields.EmbeddedField(Address)
+
+
+def test_stats():
+    stats = instrumentation.Stats()
+    instrumentation.add_listener(stats)
+    try:
+        assert instrumentation.is_enabled()
+        person = Person(name='Alan', address={'street': 'Main'})
+        assert person.age == 18
+        person.to_struct()
+    finally:
+        instrumentation.remove_listener(stats)
+
+    entries = stats.entries
+    assert entries['Person', 'name', 'parse_value'].count == 1
+    assert entries['Person', 'address', 'embed_type'].count == 1
+    assert entries['Person', 'age', 'default'].count == 1
+    assert entries['Person', 'name', 'to_struct'].count == 1
+    assert entries['Address', 'street', 'parse_value'].count == 1
+    assert entries['Person', 'address', 'validate'].time > 0
+
+    by_model = stats.by_model()
+    assert by_model['Person', 'to_struct'].count == 3
+
+    stats.clear()
+    assert stats.entries == {}
+
+
+def test_no_overhead_when_disabled():
+    listener = instrumentation.Stats()
+    instrumentation.add_listener(listener)
+
+    class Car(models.Base):
+
+        brand = fields.StringField()
+
+    assert 'parse_value' in vars(Car.brand)
+    instrumentation.remove_listener(listener)
+
+    assert not instrumentation.is_enabled()
+    assert 'parse_value' not in vars(Car.brand)
+    assert 'validate' not in vars(Person.name)
+    Car(brand='Ford')
+    assert listener.entries == {}
+
+
+def test_parse_cache_is_kept():
+
+    class Event(models.Base):
+
+        name = fields.StringField(parse_cache_size=10)
+
+    cached = Event.name.parse_value
+    calls = []
+
+    def listener(*args):
+        calls.append(args)
+
+    instrumentation.add_listener(listener)
+    try:
+        Event(name='start')
+        Event(name='start')
+    finally:
+        instrumentation.remove_listener(listener)
+
+    assert Event.name.parse_value == cached
+    assert Event.name.parse_cache.hits == 1
+    assert ('parse_value', 'Event', 'name') in [
+        call[:3] for call in calls]
+
+
+def test_fields_assigned_to_class_are_instrumented():
+    stats = instrumentation.Stats()
+    instrumentation.add_listener(stats)
+    try:
+        Generated = models_from_json_schema({
+            'title': 'Generated',
+            'type': 'object',
+            'properties': {'name': {'type': 'string'}},
+        }, name='Generated')
+        Person.nickname = fields.StringField()
+        Generated(name='Alan')
+        Person(name='Alan', nickname='Al')
+    finally:
+        instrumentation.remove_listener(stats)
+        del Person.nickname
+
+    assert stats.entries['Generated', 'name', 'parse_value'].count == 1
+    assert stats.entries['Person', 'nickname', 'parse_value'].count == 1
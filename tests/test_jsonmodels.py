@@ -330,6 +330,43 @@ def test_get_field():
     assert alan.get_field('age') is age_field
 
 
+def test_get_field_by_structure_name():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+        surname = fields.StringField(name='last-name')
+
+    assert Person.get_field_by_structure_name('name') is Person.name
+    assert Person.get_field_by_structure_name('last-name') is Person.surname
+    with pytest.raises(errors.FieldNotFound):
+        Person.get_field_by_structure_name('surname')
+    with pytest.raises(errors.FieldNotFound):
+        Person.get_field('last-name')
+
+
+def test_field_lookup_follows_class_changes():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    class Employee(Person):
+
+        pass
+
+    assert [name for name, _ in Employee.iterate_over_fields()] == ['name']
+
+    age_field = fields.IntField()
+    Person.age = age_field
+    assert Employee.get_field('age') is age_field
+    assert Employee(age=3).age == 3
+
+    del Person.age
+    with pytest.raises(errors.FieldNotFound):
+        Employee.get_field('age')
+
+
 def test_repr():
 
     class Person(models.Base):
@@ -366,6 +403,71 @@ def test_repr():
     assert chuck.__str__() == 'Testa'
 
 
+def test_repr_does_not_install_defaults():
+
+    class Person(models.Base):
+
+        name = fields.StringField(required=True)
+        age = fields.IntField(default=18)
+        names = fields.ListField(str)
+
+    chuck = Person()
+
+    assert repr(chuck) == 'Person(age=18)'
+    assert chuck._cache_key not in Person.name.memory
+    assert chuck._cache_key not in Person.age.memory
+    assert chuck._cache_key not in Person.names.memory
+
+
+class Node(models.Base):
+
+    repr_max_items = 2
+
+    value = fields.IntField()
+    children = fields.ListField(['Node'])
+    tags = fields.MapField(fields.StringField(), fields.IntField())
+
+
+def test_repr_limits():
+
+    node = Node(value=1, tags={'a': 1, 'b': 2, 'c': 3}, children=[
+        Node(children=[Node(value=3, children=[Node()])]),
+        Node(value=4),
+        Node(value=5),
+    ])
+
+    assert repr(node) == (
+        "Node(children=[Node(children=[...]), Node(value=4), "
+        "... (1 more)], tags={'a': 1, 'b': 2, ... (1 more)}, value=1)"
+    )
+
+
+def test_repr_of_sets():
+
+    class Tag(models.FrozenBase):
+
+        name = fields.StringField()
+
+    class Post(models.Base):
+
+        repr_max_items = 2
+        repr_max_depth = 2
+
+        labels = fields.SetField(fields.IntField())
+        tags = fields.SetField(fields.EmbeddedField(Tag))
+
+    class FrozenPost(models.FrozenBase):
+
+        labels = fields.SetField(fields.IntField())
+
+    post = Post(labels=[1, 2, 3], tags=[{'name': 'x'}])
+    assert repr(post) == (
+        'Post(labels={1, 2, ... (1 more)}, tags={Tag(...)})')
+    assert repr(Post(labels=[])) == 'Post(labels=set())'
+    assert repr(FrozenPost(labels=[1])) == (
+        'FrozenPost(labels=frozenset({1}))')
+
+
 def test_list_field_with_non_model_types():
 
     class Person(models.Base):
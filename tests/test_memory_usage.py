@@ -1,8 +1,10 @@
+import gc
 import platform
 
 from pytest import mark
 
-from jsonmodels.fields import StringField
+from jsonmodels.fields import StringField, ListField, ShardedMemory
+from jsonmodels.memory import sizeof, usage
 from jsonmodels.models import Base
 
 
@@ -28,3 +30,69 @@ def test_garbage_collecting():
     assert second == third
     assert third > four
     assert first == four
+
+
+@mark.skipif(
+    platform.python_implementation() == 'PyPy',
+    reason="PyPy's weakref implementation is not stable."
+)
+def test_sharded_memory():
+    memory = ShardedMemory(shards=4)
+    first = User()
+    second = User()
+
+    memory[first._cache_key] = 'Bob'
+    assert memory.setdefault(first._cache_key, 'Frank') == 'Bob'
+    assert memory.setdefault(second._cache_key, 'Frank') == 'Frank'
+    assert first._cache_key in memory
+    assert memory[first._cache_key] == 'Bob'
+    assert memory.get(User()._cache_key, 'none') == 'none'
+    assert len(memory) == 2
+    assert sorted(value for _, value in memory.items()) == ['Bob', 'Frank']
+
+    del memory[second._cache_key]
+    assert list(memory) == [first._cache_key]
+    del first
+    assert len(memory) == 0
+
+
+class Team(Base):
+
+    name = StringField()
+    members = ListField(User)
+
+
+def test_sizeof():
+    team = Team(name='A', members=[User(name='Bob'), User(name='Frank')])
+
+    shallow = sizeof(team, deep=False)
+    deep = sizeof(team)
+    assert 0 < shallow < deep
+    assert deep > shallow + 2 * sizeof(User(name='Bob'))
+
+    team.members.append(User(name='Eve'))
+    assert sizeof(team) > deep
+
+
+@mark.skipif(
+    platform.python_implementation() == 'PyPy',
+    reason="PyPy's weakref implementation is not stable."
+)
+def test_usage():
+    teams = [Team(name=str(i)) for i in range(3)]
+
+    report = usage(Team)
+    assert report.instances == 3
+    assert report.fields['name'].entries == 3
+    assert report.fields['name'].orphaned == 0
+    assert report.bytes > report.fields['name'].bytes > 0
+
+    key = teams.pop()._cache_key
+    gc.collect()
+    report = usage(Team)
+    assert report.instances == 2
+    assert report.fields['name'].entries == 3
+    assert report.fields['name'].orphaned == 1
+
+    del key
+    assert usage(Team).fields['name'].entries == 2
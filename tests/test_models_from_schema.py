@@ -0,0 +1,164 @@
+import pytest
+
+from jsonmodels import models, fields, validators, errors
+from jsonmodels.parsers import models_from_json_schema
+from jsonmodels.utilities import compare_schemas
+
+from .utilities import get_fixture
+
+
+def test_models_from_json_schema():
+
+    class Address(models.Base):
+
+        street = fields.StringField(required=True)
+        number = fields.FloatField(validators=validators.Min(1))
+
+    class Person(models.Base):
+
+        name = fields.StringField(
+            required=True, help_text='Full name.',
+            validators=[validators.Length(1, 20), validators.Regex('^[A-Z]')])
+        surname = fields.StringField(name='last-name', default='Doe')
+        height = fields.FloatField(nullable=True)
+        alive = fields.BoolField()
+        kind = fields.StringField(
+            nullable=True, validators=validators.Enum('a', 'b'))
+        address = fields.EmbeddedField(Address)
+        tags = fields.ListField(str, item_validators=validators.Length(2))
+        data = fields.MapField(fields.StringField(), fields.IntField())
+
+    schema = Person.to_json_schema()
+    Generated = models_from_json_schema(schema, name='Person')
+
+    assert Generated.__name__ == 'Person'
+    assert compare_schemas(Generated.to_json_schema(), schema)
+
+    person = Generated(name='Alan', address={'street': 'Main', 'number': 1},
+                       tags=['ab'], data={'x': {'y': 1}})
+    assert person.last_name == 'Doe'
+    assert person.address.street == 'Main'
+    assert type(person.address).__name__ == 'Address'
+    assert person.get_field('name').help_text == 'Full name.'
+    assert person.to_struct()['last-name'] == 'Doe'
+
+    with pytest.raises(errors.ValidationError):
+        Generated(name='alan')
+    with pytest.raises(errors.ValidationError):
+        Generated(name='Alan', kind='c')
+    with pytest.raises(errors.ValidationError):
+        Generated(name='Alan', tags=['a'])
+    with pytest.raises(errors.ValidationError):
+        Generated(name='Alan', address={'number': 0})
+    with pytest.raises(errors.ValidationError):
+        Generated().validate()
+
+
+def test_models_from_json_schema_with_references():
+    schema = get_fixture('schema_circular2.json')
+    Generated = models_from_json_schema(schema)
+
+    directory_type, file_type = Generated.children.items_types
+    assert directory_type.__name__ == 'TestsTestCircularReferencesDirectory'
+    assert directory_type.children.items_types == (directory_type, file_type)
+    assert isinstance(file_type.size, fields.FloatField)
+
+    root = Generated(name='/', children=[
+        directory_type(name='home', children=[file_type(name='a', size=1)])
+    ])
+    assert root.to_struct() == {
+        'name': '/',
+        'children': [{'name': 'home', 'children': [{'name': 'a', 'size': 1}]}]
+    }
+
+
+def test_models_from_json_schema_with_standard_references():
+    schema = {
+        'title': 'tree node',
+        'type': 'object',
+        'properties': {
+            'value': {'type': ['integer', 'null'], 'exclusiveMaximum': 10},
+            'parent': {'oneOf': [{'$ref': '#'}, {'type': 'null'}]},
+            'label': {'$ref': '#/definitions/label'},
+        },
+        'definitions': {
+            'label': {'type': ['string', 'null'], 'maxLength': 3}},
+    }
+    Node = models_from_json_schema(schema)
+
+    assert Node.__name__ == 'TreeNode'
+    assert Node.parent.types == (Node,)
+    assert Node.parent.nullable
+    node = Node(value=1, label='abc', parent={'value': 2})
+    assert node.parent.value == 2
+
+    with pytest.raises(errors.ValidationError):
+        Node(value=10)
+    with pytest.raises(errors.ValidationError):
+        Node(label='abcd')
+
+
+def test_generated_models_are_cached():
+    schema = get_fixture('schema1.json')
+
+    assert models_from_json_schema(schema) is models_from_json_schema(
+        dict(schema))
+    assert models_from_json_schema(schema) is not models_from_json_schema(
+        schema, name='Other')
+
+
+def test_models_from_json_schema_with_unique_items():
+
+    class Post(models.Base):
+
+        labels = fields.SetField(
+            fields.StringField(validators=validators.Length(maximum_value=5)))
+
+    schema = Post.to_json_schema()
+    Generated = models_from_json_schema(schema)
+
+    assert isinstance(Generated.labels, fields.SetField)
+    assert compare_schemas(Generated.to_json_schema(), schema)
+    assert Generated(labels=['b', 'a', 'a']).to_struct() == {
+        'labels': ['a', 'b']}
+
+
+def test_models_from_json_schema_with_clashing_names():
+    schema = {
+        'type': 'object',
+        'properties': {
+            'a-b': {'type': 'string'},
+            'a_b': {'type': 'integer'},
+            'a_b_': {'type': 'boolean'},
+        },
+    }
+    Generated = models_from_json_schema(schema)
+
+    model = Generated(**{'a-b': 'x', 'a_b': 1, 'a_b_': True})
+    assert model.to_struct() == {'a-b': 'x', 'a_b': 1, 'a_b_': True}
+    assert len(list(Generated.iterate_over_fields())) == 3
+
+
+def test_models_from_json_schema_with_unknown_format():
+    Generated = models_from_json_schema({
+        'type': 'object',
+        'properties': {
+            'email': {'type': 'string', 'format': 'email'},
+            'count': {'type': 'integer', 'format': 'int64'},
+        },
+    })
+
+    assert isinstance(Generated.email, fields.StringField)
+    assert isinstance(Generated.count, fields.IntField)
+    with pytest.raises(errors.ValidationError):
+        Generated(email=123)
+
+
+def test_models_from_json_schema_with_invalid_names():
+    for name in ('first name', 'a.b'):
+        with pytest.raises(ValueError) as info:
+            models_from_json_schema({
+                'type': 'object',
+                'properties': {name: {'type': 'string'}},
+            })
+        assert name in info.value.args
@@ -0,0 +1,48 @@
+import pickle
+
+import pytest
+
+from jsonmodels import models, fields, errors
+
+
+class Item(models.Base):
+
+    sku = fields.StringField(required=True)
+    amount = fields.IntField()
+
+
+STRUCTS = [{'sku': str(index), 'amount': index} for index in range(10)]
+WRONG_STRUCTS = STRUCTS[:3] + [{'amount': 3}, {'sku': 4, 'amount': 'four'}]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_many_parallel(workers):
+    items = Item.parse_many_parallel(STRUCTS, workers=workers, chunksize=3)
+
+    assert [item.to_struct() for item in items] == STRUCTS
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_many_parallel_errors(workers):
+    with pytest.raises(errors.ValidationError):
+        Item.parse_many_parallel(WRONG_STRUCTS, workers=workers, chunksize=2)
+
+    found = Item.parse_many_parallel(
+        iter(WRONG_STRUCTS), workers=workers, chunksize=2, errors_only=True)
+
+    assert [index for index, _ in found] == [3, 4]
+    assert isinstance(found[0][1], errors.FieldValidationError)
+    assert found[0][1].field_name == 'sku'
+    assert Item.parse_many_parallel([], workers=workers) == []
+
+
+def test_pickle_errors():
+    error = errors.FieldValidationError(
+        'Item', 'sku', None, errors.RequiredFieldError())
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert type(restored) is errors.FieldValidationError
+    assert str(restored) == str(error)
+    assert restored.field_name == 'sku'
+    assert isinstance(restored.error, errors.RequiredFieldError)
@@ -0,0 +1,186 @@
+import pytest
+
+from jsonmodels import models, fields, errors, validators
+from jsonmodels.utilities import merge_patch
+
+
+class Address(models.Base):
+
+    street = fields.StringField(required=True)
+    city = fields.StringField()
+
+
+class Country(models.FrozenBase):
+
+    code = fields.StringField()
+    name = fields.StringField()
+
+
+class Person(models.Base):
+
+    name = fields.StringField(required=True)
+    age = fields.IntField()
+    surname = fields.StringField(name='last-name')
+    address = fields.EmbeddedField(Address)
+    country = fields.EmbeddedField(Country)
+    tags = fields.ListField(str)
+    addresses = fields.MapField(
+        fields.StringField(), fields.EmbeddedField(Address))
+    extra = fields.GenericField()
+
+
+def test_merge_patch():
+    target = {'a': 'b', 'c': {'d': 'e', 'f': 'g'}, 'h': [1]}
+    patch = {'a': 'z', 'c': {'f': None, 'x': {'y': None}}, 'h': [2]}
+
+    assert merge_patch(target, patch) == {
+        'a': 'z', 'c': {'d': 'e', 'x': {}}, 'h': [2]}
+    assert target == {'a': 'b', 'c': {'d': 'e', 'f': 'g'}, 'h': [1]}
+    assert merge_patch({'a': 1}, ['b']) == ['b']
+    assert merge_patch(None, {'a': None, 'b': 1}) == {'b': 1}
+
+
+def test_apply_patch():
+    person = Person(
+        name='John', age=30, surname='Doe', tags=['a', 'b'],
+        address={'street': 'Main', 'city': 'Springfield'},
+        country={'code': 'US', 'name': 'USA'},
+        addresses={'home': {'street': 'Elm'}, 'work': {'street': 'Oak'}},
+        extra={'a': 1, 'b': {'c': 2}},
+    )
+    address = person.address
+
+    person.apply_patch({
+        'age': '31',
+        'last-name': None,
+        'address': {'city': None},
+        'country': {'name': 'United States'},
+        'tags': ['c'],
+        'addresses': {'home': {'city': 'Boston'}, 'work': None,
+                      'other': {'street': 'Pine'}},
+        'extra': {'b': {'c': None, 'd': 3}},
+        'unknown': 1,
+    })
+
+    assert person.address is not address
+    assert address.city == 'Springfield'
+    assert person.to_struct() == {
+        'name': 'John',
+        'age': 31,
+        'address': {'street': 'Main'},
+        'country': {'code': 'US', 'name': 'United States'},
+        'tags': ['c'],
+        'addresses': {
+            'home': {'street': 'Elm', 'city': 'Boston'},
+            'other': {'street': 'Pine'},
+        },
+        'extra': {'a': 1, 'b': {'d': 3}},
+    }
+
+
+def test_apply_patch_to_unset_fields():
+    person = Person(name='John')
+
+    person.apply_patch({
+        'address': {'street': 'Main', 'city': None},
+        'addresses': {'home': {'street': 'Elm'}, 'work': None},
+    })
+
+    assert person.address.to_struct() == {'street': 'Main'}
+    assert person.addresses['home'].street == 'Elm'
+    assert 'work' not in person.addresses
+
+
+def test_apply_patch_validation():
+    person = Person(name='John', address={'street': 'Main'})
+
+    with pytest.raises(errors.FieldValidationError) as info:
+        person.apply_patch({'age': 'old'})
+    assert info.value.field_name == 'age'
+
+    with pytest.raises(errors.ValidationError):
+        person.apply_patch({'name': None})
+    with pytest.raises(errors.ValidationError):
+        person.apply_patch({'address': {'street': None}})
+    with pytest.raises(errors.ValidationError):
+        person.apply_patch({'addresses': {'home': {'street': 1}}})
+
+
+def test_failed_patch_leaves_field_untouched():
+
+    class Car(models.Base):
+        color = fields.StringField()
+        wheels = fields.IntField(validators=validators.Min(3))
+
+    class Garage(models.Base):
+        car = fields.EmbeddedField(Car)
+        counts = fields.MapField(
+            fields.StringField(), fields.IntField(),
+            validators=[validators.Length(0, 1)])
+        cars = fields.MapField(fields.StringField(), fields.EmbeddedField(Car))
+
+    garage = Garage(car={'color': 'red', 'wheels': 4}, counts={'a': 1},
+                    cars={'x': {'color': 'red', 'wheels': 4}})
+    car = garage.car
+
+    with pytest.raises(errors.ValidationError):
+        garage.apply_patch({'counts': {'b': 2}})
+    assert garage.counts == {'a': 1}
+
+    with pytest.raises(errors.ValidationError):
+        garage.apply_patch({'car': {'color': 'blue', 'wheels': 1}})
+    assert garage.car is car
+    assert car.to_struct() == {'color': 'red', 'wheels': 4}
+
+    with pytest.raises(errors.ValidationError):
+        garage.apply_patch({'cars': {'x': {'color': 'blue', 'wheels': 1}}})
+    assert garage.cars['x'].to_struct() == {'color': 'red', 'wheels': 4}
+
+
+def test_apply_patch_to_frozen_model():
+    country = Country(code='US')
+
+    with pytest.raises(errors.FrozenModelError):
+        country.apply_patch({'name': 'USA'})
+
+
+def test_diff():
+    first = Person(
+        name='John', surname='Doe', tags=['a', 'b'],
+        address={'street': 'Main', 'city': 'Springfield'},
+        country={'code': 'US'},
+        addresses={'home': {'street': 'Elm'}, 'work': {'street': 'Oak'}},
+    )
+    second = Person(
+        name='John', surname='Smith', tags=['a', 'c', 'd'],
+        address={'street': 'Main'}, country=first.country,
+        addresses={'home': {'street': 'Pine'}, 'other': {'street': 'Oak'}},
+        extra=1,
+    )
+
+    assert first.diff(first) == []
+    assert first.diff(second) == [
+        models.Change(('address', 'city'), 'Springfield', None),
+        models.Change(('addresses', 'home', 'street'), 'Elm', 'Pine'),
+        models.Change(
+            ('addresses', 'work'), first.addresses['work'], fields.NotSet),
+        models.Change(
+            ('addresses', 'other'), fields.NotSet, second.addresses['other']),
+        models.Change(('extra',), None, 1),
+        models.Change(('last-name',), 'Doe', 'Smith'),
+        models.Change(('tags', 1), 'b', 'c'),
+        models.Change(('tags', 2), fields.NotSet, 'd'),
+    ]
+    assert second.diff(Person(name='John')) == [
+        models.Change(('address',), second.address, None),
+        models.Change(('addresses',), second.addresses, None),
+        models.Change(('country',), second.country, None),
+        models.Change(('extra',), 1, None),
+        models.Change(('last-name',), 'Smith', None),
+        models.Change(('tags', 0), 'a', fields.NotSet),
+        models.Change(('tags', 1), 'c', fields.NotSet),
+        models.Change(('tags', 2), 'd', fields.NotSet),
+    ]
+
+    with pytest.raises(TypeError):
+        first.diff(Address())
@@ -0,0 +1,85 @@
+import datetime
+import pickle
+
+import pytest
+
+from jsonmodels import models, fields, errors
+
+
+class Country(models.FrozenBase):
+
+    code = fields.StringField()
+    languages = fields.ListField(str)
+
+
+class Address(models.Base):
+
+    street = fields.StringField()
+    country = fields.EmbeddedField(Country)
+
+
+class Person(models.Base):
+
+    name = fields.StringField(required=True)
+    age = fields.IntField(default=18)
+    born = fields.DateTimeField()
+    addresses = fields.ListField(Address)
+    tags = fields.ListField(str)
+    scores = fields.MapField(fields.StringField(), fields.IntField())
+
+
+class Employee(Person):
+
+    def __init__(self, **kwargs):
+        super(Employee, self).__init__(**kwargs)
+        self.extra = {'badge': 1}
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    person = Person(
+        name='John', born=datetime.datetime(2000, 1, 1),
+        addresses=[{'street': 'Main', 'country': {
+            'code': 'US', 'languages': ['en']}}],
+        scores={'math': 1},
+    )
+    person.tags.append('a')
+
+    restored = pickle.loads(pickle.dumps(person, protocol))
+
+    assert restored is not person
+    assert restored == person
+    assert restored.to_struct() == person.to_struct()
+    assert restored.age == 18
+    assert hash(restored.addresses[0].country) == hash(
+        person.addresses[0].country)
+
+    restored.tags.append('b')
+    assert person.tags == ['a']
+    with pytest.raises(errors.ValidationError):
+        restored.tags.append(1)
+    with pytest.raises(errors.FrozenModelError):
+        restored.addresses[0].country.code = 'PL'
+
+
+def test_pickle_unset_values():
+    restored = pickle.loads(pickle.dumps(Person()))
+
+    assert restored._cache_key not in Person.name.memory
+    assert fields.NotSet is pickle.loads(pickle.dumps(fields.NotSet))
+
+
+def test_pickle_other_attributes():
+    restored = pickle.loads(pickle.dumps(Employee(name='John')))
+
+    assert restored.name == 'John'
+    assert restored.extra == {'badge': 1}
+    assert len(Person(name='John').__getstate__()) == len(
+        Employee(name='John').__getstate__()) - 1
+
+
+def test_wrong_state():
+    person = Person.__new__(Person)
+
+    with pytest.raises(ValueError):
+        person.__setstate__(('John',))
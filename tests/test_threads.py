@@ -0,0 +1,82 @@
+import sys
+import threading
+
+from jsonmodels import models, fields
+
+THREADS = 16
+
+
+class Leaf(models.Base):
+
+    name = fields.StringField()
+
+
+def _run_in_threads(target):
+    barrier = threading.Barrier(THREADS)
+    results = []
+    failures = []
+
+    def run():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as error:  # pragma: no cover
+            failures.append(error)
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible.
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert failures == []
+    return results
+
+
+def test_lazy_types_are_resolved_concurrently():
+
+    class Tree(models.Base):
+
+        leaf = fields.EmbeddedField('tests.test_threads.Leaf')
+        leaves = fields.ListField(['tests.test_threads.Leaf'])
+        named = fields.MapField(
+            fields.StringField(),
+            fields.EmbeddedField('tests.test_threads.Leaf'))
+
+    def build():
+        for index in range(100):
+            tree = Tree(
+                leaf={'name': str(index)},
+                leaves=[{'name': 'a'}, Leaf(name='b')],
+                named={'c': {'name': 'c'}},
+            )
+            tree.validate()
+        return tree.to_struct()
+
+    results = _run_in_threads(build)
+
+    assert len(results) == THREADS
+    assert Tree.leaf.types == (Leaf,)
+    assert Tree.leaves.items_types == (Leaf,)
+
+
+def test_defaults_are_installed_once():
+
+    class Tree(models.Base):
+
+        leaves = fields.ListField(Leaf)
+        tags = fields.ListField(str, default=['a'])
+
+    trees = [Tree() for _ in range(100)]
+
+    def read():
+        return [(id(tree.leaves), id(tree.tags)) for tree in trees]
+
+    results = _run_in_threads(read)
+
+    assert all(result == results[0] for result in results)
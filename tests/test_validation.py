@@ -90,7 +90,7 @@ def test_validators_are_always_iterable():
 
     alan = Person()
 
-    assert isinstance(alan.get_field('children').validators, list)
+    assert isinstance(alan.get_field('children').validators, tuple)
 
 
 def test_item_validators_are_always_iterable():
@@ -101,7 +101,7 @@ def test_item_validators_are_always_iterable():
 
     alan = Person()
 
-    assert isinstance(alan.get_field('children').item_validators, list)
+    assert isinstance(alan.get_field('children').item_validators, tuple)
 
 
 def test_get_field_not_found():
@@ -399,3 +399,111 @@ def test_enum_validation():
 
     with pytest.raises(errors.ValidationError):
         validator.validate('horse')
+
+
+def test_validator_attribute_error_is_not_swallowed():
+
+    def validator(value):
+        raise AttributeError('broken validator')
+
+    class Person(models.Base):
+
+        name = fields.StringField(validators=validator)
+        tags = fields.ListField(str, item_validators=validator)
+
+    person = Person()
+    with pytest.raises(AttributeError):
+        person.name = 'John'
+    with pytest.raises(AttributeError):
+        person.tags.append('news')
+
+
+def test_validation_follows_field_configuration_changes():
+
+    class Person(models.Base):
+
+        name = fields.StringField()
+
+    field = Person.name
+    field.validate(None)
+
+    field.required = True
+    with pytest.raises(errors.RequiredFieldError):
+        field.validate(None)
+
+    field.required = False
+    field.validators = [validators.Length(maximum_value=3)]
+    field.validate('Bob')
+    with pytest.raises(errors.MaxLengthError):
+        field.validate('Alice')
+
+    with pytest.raises(AttributeError):
+        field.validators.append(validators.Length(maximum_value=10))
+
+
+def test_item_validators_can_be_changed():
+
+    class Person(models.Base):
+
+        names = fields.ListField(str)
+
+    field = Person.names
+    field.validate(['Alice'])
+
+    field.item_validators = [validators.Length(maximum_value=3)]
+    assert isinstance(field.item_validators, tuple)
+    field.validate(['Bob'])
+    with pytest.raises(errors.MaxLengthError):
+        field.validate(['Alice'])
+
+
+def test_collection_validates_all_mutations():
+
+    validator = FakeValidator()
+
+    class Article(models.Base):
+
+        tags = fields.ListField(str, item_validators=[validator])
+
+    article = Article()
+    tags = article.tags
+    tags.extend(['a', 'b'])
+    tags.insert(0, 'c')
+    tags += ['d']
+    tags[1:2] = ['e', 'f']
+    assert tags == ['c', 'e', 'f', 'b', 'd']
+    assert validator.called_amount == 6
+
+    for mutate in (
+        lambda: tags.extend(['g', 1]),
+        lambda: tags.insert(0, 1),
+        lambda: tags.__iadd__(['g', 1]),
+        lambda: tags.__setitem__(slice(0, 1), ['g', 1]),
+    ):
+        with pytest.raises(errors.ValidationError):
+            mutate()
+    assert tags == ['c', 'e', 'f', 'b', 'd']
+
+    validator.called_amount = 0
+    article.validate()
+    assert validator.called_amount == 0
+
+
+def test_assigned_lists_validate_mutations():
+
+    class Article(models.Base):
+
+        tags = fields.ListField(str)
+        numbers = fields.DerivedListField(fields.IntField())
+
+    article = Article(tags=['b'], numbers=[1])
+    with pytest.raises(errors.ValidationError):
+        article.tags.append(5)
+    with pytest.raises(errors.ValidationError):
+        article.numbers += ['x']
+
+    article.tags = ['c']
+    with pytest.raises(errors.ValidationError):
+        article.tags[0:1] = [5]
+    assert article.tags == ['c']
+    assert article.numbers == [1]